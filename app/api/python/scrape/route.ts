@@ -19,6 +19,23 @@ export async function POST(req: NextRequest) {
       return NextResponse.json({ error: 'URL is required' }, { status: 400 });
     }
 
+    // Prefer a resident scraper (`python vc_scraper.py --serve`) when one is configured
+    const serviceUrl = process.env.SCRAPER_SERVICE_URL;
+    if (serviceUrl) {
+      const response = await fetch(`${serviceUrl.replace(/\/$/, '')}/scrape`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ url, format: 'csv' }),
+      });
+      const body = await response.text();
+      return new NextResponse(body, {
+        status: response.status,
+        headers: {
+          'Content-Type': response.headers.get('Content-Type') || 'text/csv',
+        },
+      });
+    }
+
     // Get absolute paths
     const rootDir = process.cwd();
     const scriptPath = path.join(rootDir, 'vc_scraper.py');
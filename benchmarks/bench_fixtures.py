@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+bench_fixtures.py
+-----------------
+Runs the full scraper offline against recorded portfolio pages served from a local
+HTTP server, one fresh process and state store per case. Reports wall time, HTTP
+requests, browser round trips, peak RSS, the method used and row accuracy against
+each case's ``golden.csv``; fails when a case's F1 drops below ``--min-f1``.
+
+Cases (``benchmarks/fixtures/<case>/``):
+    static-cards     anchor-wrapped Webflow cards in plain HTML
+    wp-api           WordPress REST collection, paginated by the server
+    nextjs           companies embedded in __NEXT_DATA__
+    infinite-scroll  cards appended from JSON as the page scrolls      (needs Chromium)
+    detail-pages     cards link to on-site profiles holding the website (needs Chromium)
+
+Example:
+    python benchmarks/bench_fixtures.py                       # every case
+    python benchmarks/bench_fixtures.py wp-api nextjs --runs 3
+    python benchmarks/bench_fixtures.py --update-golden static-cards
+"""
+
+import argparse, csv, json, os, statistics, subprocess, sys, tempfile, threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+CASES = {  # case -> (portfolio path on the fixture server, needs a browser)
+    "static-cards":    ("/static-cards/", False),
+    "wp-api":          ("/wp-api/", False),
+    "nextjs":          ("/nextjs/", False),
+    "infinite-scroll": ("/infinite-scroll/", True),
+    "detail-pages":    ("/detail-pages/companies/", True),
+}
+WP_COLLECTION = "/wp-json/wp/v2/portfolio"
+
+# ── fixture server ───────────────────────────────────────────────────
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    """Static files from FIXTURES, plus WordPress-style paging of ``…/wp-json/wp/v2/portfolio``."""
+    counts = None  # Counter-like dict shared with the server, set in serve_fixtures
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(FIXTURES), **kwargs)
+
+    def log_message(self, *args):
+        pass
+
+    def _count(self):
+        self.counts["requests"] = self.counts.get("requests", 0) + 1
+
+    def do_HEAD(self):
+        self._count()
+        super().do_HEAD()
+
+    def do_GET(self):
+        self._count()
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip("/").endswith(WP_COLLECTION):
+            return self._wp_collection(parsed)
+        super().do_GET()
+
+    def _wp_collection(self, parsed):
+        source = FIXTURES / (parsed.path.lstrip("/").rstrip("/") + ".json")
+        if not source.is_file():
+            return self.send_error(404)
+        items = json.loads(source.read_text(encoding="utf-8"))
+        query = parse_qs(parsed.query)
+        per_page = int(query.get("per_page", ["10"])[0])
+        page = int(query.get("page", ["1"])[0])
+        pages = max(1, -(-len(items) // per_page))
+        if per_page > 100 or page > pages:
+            return self.send_error(400)
+        body = json.dumps(items[(page - 1) * per_page:page * per_page]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-WP-Total", str(len(items)))
+        self.send_header("X-WP-TotalPages", str(pages))
+        self.end_headers()
+        self.wfile.write(body)
+
+def serve_fixtures():
+    """Start the fixture server on a free port; returns ``(server, counts)``."""
+    counts = {}
+    handler = type("FixtureHandler", (_FixtureHandler,), {"counts": counts})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, counts
+
+# ── one case, in a fresh process ─────────────────────────────────────
+# Runs in the child with VC_SCRAPER_STATE pointing at an empty directory. Every
+# public method of the Playwright objects the scraper drives is one round trip
+# to the browser, so they are wrapped with a counter before the scrape starts.
+_CHILD = """
+import functools, json, resource, sys, time
+import vc_scraper
+
+trips = [0]
+def _count_trips():
+    try:
+        from playwright.sync_api import BrowserContext, ElementHandle, Locator, Page
+    except ImportError:
+        return
+    for cls in (Page, BrowserContext, ElementHandle, Locator):
+        for name, fn in list(vars(cls).items()):
+            if name.startswith("_") or not callable(fn):
+                continue
+            def counted(*a, _fn=fn, **kw):
+                trips[0] += 1
+                return _fn(*a, **kw)
+            setattr(cls, name, functools.wraps(fn)(counted))
+_count_trips()
+
+started = time.perf_counter()
+records = list(vc_scraper.iter_companies(sys.argv[1]))
+elapsed = time.perf_counter() - started
+methods = [r["method"] for r in records]
+print("@@" + json.dumps({
+    "seconds": elapsed, "trips": trips[0],
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "child_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    "method": max(set(methods), key=methods.count) if methods else "-",
+    "rows": [[r["company"], r["url"]] for r in records],
+}))
+"""
+
+def run_case(base: str, case: str, counts: dict, verbose: bool = False) -> dict:
+    """Scrape one case in a child process; the request count comes from the server."""
+    before = counts.get("requests", 0)
+    with tempfile.TemporaryDirectory(prefix="vc-bench-") as state:
+        env = dict(os.environ, VC_SCRAPER_STATE=state, PYTHONUNBUFFERED="1")
+        proc = subprocess.run([sys.executable, "-c", _CHILD, base + CASES[case][0]], cwd=ROOT,
+                              env=env, capture_output=True, text=True)
+    if verbose or proc.returncode:
+        sys.stderr.write(proc.stdout + proc.stderr)
+    if proc.returncode:
+        raise RuntimeError(f"{case}: scraper exited with {proc.returncode}")
+    result = json.loads(proc.stdout.rsplit("@@", 1)[1])
+    result["requests"] = counts.get("requests", 0) - before
+    return result
+
+# ── accuracy ─────────────────────────────────────────────────────────
+def read_golden(case: str) -> list:
+    with open(FIXTURES / case / "golden.csv", newline="", encoding="utf-8") as f:
+        return [(row["Company"], row["URL"]) for row in csv.DictReader(f)]
+
+def write_golden(case: str, rows: list) -> None:
+    with open(FIXTURES / case / "golden.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Company", "URL"])
+        writer.writerows(rows)
+
+def score(found: list, golden: list) -> tuple:
+    """Precision, recall and F1; a row counts when its URL and name both match a golden row."""
+    from vc_scraper import company_key
+    expected = {company_key(url): name.strip().lower() for name, url in golden}
+    hits = {company_key(url) for name, url in found if expected.get(company_key(url)) == name.strip().lower()}
+    precision = len(hits) / len(found) if found else 0.0
+    recall = len(hits) / len(expected) if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+def have_chromium() -> bool:
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as p:
+            return Path(p.chromium.executable_path).exists()
+    except Exception:
+        return False
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("cases", nargs="*", metavar="case", help=f"subset of: {', '.join(CASES)}")
+    parser.add_argument("--runs", type=int, default=1, help="runs per case; wall time is the median")
+    parser.add_argument("--min-f1", type=float, default=0.95)
+    parser.add_argument("--update-golden", action="store_true", help="overwrite golden.csv with this run's rows")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the scraper's own output")
+    args = parser.parse_args()
+    unknown = [case for case in args.cases if case not in CASES]
+    if unknown:
+        parser.error(f"unknown case: {', '.join(unknown)}")
+
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault("VERCEL", "1")  # never download Chromium from a benchmark
+    server, counts = serve_fixtures()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    chromium = None
+    failed = []
+
+    print(f"{'case':<16} {'method':<10} {'rows':>5} {'P':>6} {'R':>6} {'F1':>6} "
+          f"{'wall s':>7} {'reqs':>5} {'trips':>6} {'RSS MB':>7} {'child MB':>8}")
+    for case in args.cases or list(CASES):
+        if CASES[case][1]:
+            chromium = have_chromium() if chromium is None else chromium
+            if not chromium:
+                print(f"{case:<16} skipped: no Chromium (playwright install chromium)")
+                continue
+        results = [run_case(base, case, counts, args.verbose) for _ in range(args.runs)]
+        last = results[-1]
+        rows = [tuple(row) for row in last["rows"]]
+        if args.update_golden:
+            write_golden(case, rows)
+        precision, recall, f1 = score(rows, read_golden(case))
+        print(f"{case:<16} {last['method']:<10} {len(rows):>5} {precision:>6.2f} {recall:>6.2f} {f1:>6.2f} "
+              f"{statistics.median(r['seconds'] for r in results):>7.2f} {last['requests']:>5} "
+              f"{last['trips']:>6} {max(r['rss_mb'] for r in results):>7.0f} "
+              f"{max(r['child_rss_mb'] for r in results):>8.0f}")
+        if f1 < args.min_f1:
+            failed.append(case)
+    server.shutdown()
+
+    if failed:
+        sys.exit(f"❌  below F1 {args.min_f1}: {', '.join(failed)}")
+    print("✅  every case matches its golden output")
+
+if __name__ == "__main__":
+    main()
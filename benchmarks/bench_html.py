@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+bench_html.py
+-------------
+Times the single-pass HTML extraction (``vc_scraper._analyze_html``) against the
+original multi-pass BeautifulSoup implementation and checks both agree.
+
+Example:
+    python benchmarks/bench_html.py                     # synthetic ~1.5 MB portfolio page
+    python benchmarks/bench_html.py saved_page.html https://example.vc/portfolio
+"""
+
+import contextlib, html, io, re, sys, time
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import tldextract
+from bs4 import BeautifulSoup
+
+import vc_scraper
+from vc_scraper import BLOCKLIST_DOMAINS, normalize
+
+# ── the pre-single-pass implementation, kept verbatim for comparison ─
+def legacy_analyze(url: str, html_content: str) -> dict:
+    vc_dom = tldextract.extract(url).domain.lower()
+    seen_urls, html_rows, anchor_rows, quality, more_content = set(), [], [], 0, False
+    soup = BeautifulSoup(html_content, "html.parser")
+    for a in soup.find_all("a", href=True):
+        if a.find(class_="portfolio-card"):
+            href_raw = a["href"].strip()
+            if href_raw == "//":
+                continue
+            href = urljoin(url, normalize(html.unescape(href_raw)))
+            dom = tldextract.extract(href).domain.lower()
+            if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
+                continue
+            h4 = a.find("h4")
+            name = h4.get_text(strip=True) if h4 else a.get_text(" ", strip=True)
+            name = re.sub(r"\s+", " ", name)
+            if name and len(name) <= 80 and href not in seen_urls:
+                anchor_rows.append((name, href))
+                seen_urls.add(href)
+    for a in soup.find_all("a", href=True):
+        href = urljoin(url, normalize(html.unescape(a["href"])))
+        dom = tldextract.extract(href).domain.lower()
+        if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
+            continue
+        name = re.sub(r"\s+", " ", a.get_text(" ", strip=True)) or dom.capitalize()
+        if href in seen_urls or len(name) > 100:
+            continue
+        seen_urls.add(href)
+        html_rows.append((name, href))
+    if len(anchor_rows) >= 5:
+        html_rows = anchor_rows + [row for row in html_rows if row[0] not in {r[0] for r in anchor_rows}]
+    if len(html_rows) > 10:
+        for name, _ in html_rows:
+            name_lower = name.lower()
+            if any(w in name_lower for w in vc_scraper.NAV_WORDS):
+                continue
+            if len(name) > 50 or len(name.split()) > 5:
+                continue
+            if any(w in name_lower for w in vc_scraper.DESCRIPTION_WORDS):
+                continue
+            quality += 1
+        soup_text = soup.get_text().lower()
+        more_content = bool(any(i in soup_text for i in vc_scraper.LARGE_PORTFOLIO_INDICATORS)
+                            or soup.select_one("a[class*='next'], button[class*='next'], .pagination"))
+    return {"rows": html_rows, "quality": quality, "more_content": more_content}
+
+# ── fixture ─────────────────────────────────────────────────────────
+def synthetic_page(companies: int = 6000) -> str:
+    nav = "".join(f'<li><a href="/{p}">{p.title()}</a></li>' for p in ["about", "team", "news", "contact"])
+    cards = "".join(
+        f'<a href="https://www.company{i}.com/?ref=vc#new_tab" target="_blank">'
+        f'<div class="portfolio-card card-{i % 7}"><img src="/logos/{i}.png" alt="">'
+        f'<h4>Company {i}</h4><p>Series {"ABC"[i % 3]} · Fintech · {2010 + i % 14}</p>'
+        f'<!-- card {i} --><span class="tag">Fintech</span></div></a>\n'
+        for i in range(companies)
+    )
+    footer = '<div class="pagination"><a class="next" href="?page=2">Next</a></div>'
+    script = "<script>window.__DATA__ = {" + ", ".join(f'"k{i}": {i}' for i in range(2000)) + "}</script>"
+    return (f"<html><head><title>Portfolio</title>{script}</head><body><nav><ul>{nav}</ul></nav>"
+            f"<main><h1>Over 1,000 companies</h1>{cards}</main>{footer}</body></html>")
+
+def bench(label: str, fn, *args, repeat: int = 3):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = fn(*args)
+            best = min(best, time.perf_counter() - started)
+    print(f"{label:<34} {best * 1000:9.1f} ms")
+    return result
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        page = Path(sys.argv[1]).read_text(encoding="utf-8", errors="replace")
+        url = sys.argv[2] if len(sys.argv) > 2 else "https://example.vc/portfolio"
+    else:
+        page, url = synthetic_page(), "https://example.vc/portfolio"
+    print(f"page: {len(page) / 1024 ** 2:.1f} MB")
+
+    expected = bench("legacy (multi-pass, html.parser)", legacy_analyze, url, page)
+    for parser in ("html.parser", "lxml"):
+        vc_scraper.HTML_PARSER = parser
+        try:
+            got = bench(f"single pass ({parser})", vc_scraper._analyze_html, url, page)
+        except ImportError:
+            print(f"single pass ({parser}): not installed")
+            continue
+        if {key: got[key] for key in expected} != expected:  # hydration keys have no legacy counterpart
+            sys.exit(f"❌  single pass ({parser}) disagrees with the legacy extraction")
+    print(f"✅  {len(expected['rows'])} rows, identical results")
+
+if __name__ == "__main__":
+    main()
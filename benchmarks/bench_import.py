@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+bench_import.py
+---------------
+Times a cold ``import vc_scraper`` in fresh interpreters and fails when the median
+exceeds the budget or a heavy dependency is loaded at import time.
+
+Example:
+    python benchmarks/bench_import.py               # 7 runs, 150 ms budget
+    python benchmarks/bench_import.py --budget-ms 100 --runs 15
+"""
+
+import argparse, json, statistics, subprocess, sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY = ("playwright", "bs4", "tldextract", "lxml", "httpx")
+
+# Runs in the child: the interpreter's own start-up is excluded from the timing.
+_PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import vc_scraper
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000,
+                   "heavy": sorted(m for m in {HEAVY!r} if m in sys.modules)}}))
+"""
+
+def measure(runs: int) -> tuple:
+    samples, heavy = [], set()
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _PROBE], cwd=ROOT, capture_output=True,
+                             text=True, check=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        samples.append(result["ms"])
+        heavy.update(result["heavy"])
+    return samples, sorted(heavy)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    samples, heavy = measure(args.runs)
+    median = statistics.median(samples)
+    print(f"import vc_scraper: median {median:.1f} ms, min {min(samples):.1f} ms, "
+          f"max {max(samples):.1f} ms over {len(samples)} runs (budget {args.budget_ms:.0f} ms)")
+    if heavy:
+        sys.exit(f"❌  loaded at import time: {', '.join(heavy)}")
+    if median > args.budget_ms:
+        sys.exit(f"❌  over budget by {median - args.budget_ms:.1f} ms")
+    print("✅  within budget, no heavy imports")
+
+if __name__ == "__main__":
+    main()
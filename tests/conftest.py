@@ -0,0 +1,6 @@
+import os
+import sys
+
+# vc_scraper.py is a script at the repository root, not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("VERCEL", "1")  # never try to download Chromium from a test
@@ -0,0 +1,63 @@
+import pytest
+
+import vc_scraper
+
+URL = "https://portfolio.example.vc/companies"
+
+
+@pytest.fixture(autouse=True)
+def state(tmp_path, monkeypatch):
+    """A fresh state store per test."""
+    monkeypatch.setattr(vc_scraper, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(vc_scraper, "_db_conn", None)
+
+
+def _crawl(rows):
+    """A stand-in for a Playwright crawl that streams ``rows`` and returns them."""
+    def run(url, browser=None, links=None, profile=None, on_row=None, budget=None):
+        for row in rows:
+            if on_row:
+                on_row(row)
+        return list(rows)
+    return run
+
+
+def _stream(url, monkeypatch):
+    """The rows ``iter_companies`` yields, and the rows its scrape returned."""
+    returned = []
+    extract = vc_scraper._extract
+
+    def spy(*args, **kwargs):
+        rows, strategy = extract(*args, **kwargs)
+        returned.extend(rows)
+        return rows, strategy
+    monkeypatch.setattr(vc_scraper, "_extract", spy)
+    streamed = [(r["company"], r["url"]) for r in vc_scraper.iter_companies(url)]
+    return streamed, returned
+
+
+def test_rejected_replay_streams_only_discovered_rows(monkeypatch):
+    replayed = [("Acme", "https://acme.com/"), ("Stale", "https://stale.io/")]
+    discovered = [("Acme", "https://acme.com/"), ("Bolt", "https://bolt.dev/"),
+                  ("Crate", "https://crate.ai/")]
+    monkeypatch.setattr(vc_scraper, "site_profile",
+                        lambda firm, url: {"strategy": "playwright", "rows": 40})
+    monkeypatch.setattr(vc_scraper, "_run_playwright", _crawl(replayed))
+
+    def discover(url, browser, links, hints, on_row=None, budget=None):
+        return _crawl(discovered)(url, on_row=on_row), "playwright"
+    monkeypatch.setattr(vc_scraper, "_discover", discover)
+
+    streamed, returned = _stream(URL, monkeypatch)
+    assert sorted(streamed) == sorted(returned) == sorted(discovered)
+
+
+def test_accepted_replay_streams_its_rows(monkeypatch):
+    replayed = [("Acme", "https://acme.com/"), ("Bolt", "https://bolt.dev/")]
+    monkeypatch.setattr(vc_scraper, "site_profile",
+                        lambda firm, url: {"strategy": "playwright", "rows": 2})
+    monkeypatch.setattr(vc_scraper, "_run_playwright", _crawl(replayed))
+    monkeypatch.setattr(vc_scraper, "_discover", lambda *a, **k: pytest.fail("replay was accepted"))
+
+    streamed, returned = _stream(URL, monkeypatch)
+    assert sorted(streamed) == sorted(returned) == sorted(replayed)
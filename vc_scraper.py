@@ -18,23 +18,31 @@ IS_DEPLOYMENT = any(key in os.environ for key in [
     'HEROKU', 'VERCEL', 'RAILWAY', 'RENDER'
 ])
 
-print("ℹ️  Using local Playwright browsers")
 CACHE = pathlib.Path.home() / ".cache/ms-playwright"
-need_browser = not glob.glob(str(CACHE / "chromium-*/*/chrome-linux/headless_shell"))
+_chromium_checked = False
 
-if need_browser and not IS_DEPLOYMENT:
-    try:
-        print("▶ First launch: downloading Playwright Chromium …")
-        subprocess.run(
-            [sys.executable, "-m", "playwright", "install", "--with-deps", "chromium"],
-            check=True,
-        )
-        print("✔ Chromium installed")
-    except (subprocess.CalledProcessError, PermissionError) as e:
-        print(f"⚠️  Could not install Playwright automatically: {e}")
-        print("   Please run: pip install playwright && playwright install chromium")
-elif need_browser and IS_DEPLOYMENT:
-    print("ℹ️  Running in deployment environment - Playwright should be pre-installed")
+def ensure_chromium() -> None:
+    """Download Playwright's Chromium on first use; runs once, right before a browser launch."""
+    global _chromium_checked
+    if _chromium_checked:
+        return
+    _chromium_checked = True
+    print("ℹ️  Using local Playwright browsers")
+    need_browser = not glob.glob(str(CACHE / "chromium-*/*/chrome-linux/headless_shell"))
+
+    if need_browser and not IS_DEPLOYMENT:
+        try:
+            print("▶ First launch: downloading Playwright Chromium …")
+            subprocess.run(
+                [sys.executable, "-m", "playwright", "install", "--with-deps", "chromium"],
+                check=True,
+            )
+            print("✔ Chromium installed")
+        except (subprocess.CalledProcessError, PermissionError) as e:
+            print(f"⚠️  Could not install Playwright automatically: {e}")
+            print("   Please run: pip install playwright && playwright install chromium")
+    elif need_browser and IS_DEPLOYMENT:
+        print("ℹ️  Running in deployment environment - Playwright should be pre-installed")
 # ─────────────────────────────────────────────────────────────────────
 
 # ── config ───────────────────────────────────────────────────────────
@@ -46,17 +54,87 @@ BLOCKLIST_DOMAINS = {
     "medium", "github", "youtube", "notion", "airtable",
     "calendar", "crunchbase", "google", "apple", "figma",
 }
+DETAIL_POOL_SIZE   = 4    # detail pages resolved in parallel
+DETAIL_POOL_OVERRIDES = { # per portfolio host, e.g. {"www.indexventures.com": 8}
+}
+HOST_MAX_INFLIGHT  = 4    # politeness: open detail requests per host
+HOST_INFLIGHT_OVERRIDES = { # per detail host that allows more, e.g. {"www.indexventures.com": 8}
+}
+HOST_MIN_INTERVAL  = 0.25 # politeness: seconds between requests to one host
+DETAIL_HTTP_RESOLVE = True # try redirects / static HTML for detail pages before a browser tab
+DETAIL_HTTP_TIMEOUT = 10  # seconds per plain-HTTP detail page attempt
+DETAIL_LINKS_TTL   = 30 * 24 * 3600     # seconds a resolved detail page is kept in the state store
+DETAIL_LINKS_MAX_ROWS = 100_000         # oldest resolved detail pages are evicted past this
+API_PROBE_TIMEOUT  = 10   # seconds per JSON API probe
+WP_PER_PAGE        = 100  # WordPress REST page size (the API's maximum)
+WP_FIELDS          = "title,link,acf"  # _fields projection for WordPress listings
+WP_PAGE_CONCURRENCY = 6   # WordPress listing pages fetched at once
+HTTP_MAX_CONNECTIONS = 20 # pooled connections shared by every fetch
+BLOCK_RESOURCES    = True # abort the requests below in Playwright pages
+BLOCK_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCK_HOSTS = (           # analytics / ad / chat widgets (matched as host suffixes)
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "facebook.net", "connect.facebook.net",
+    "hotjar.com", "segment.com", "segment.io", "mixpanel.com",
+    "fullstory.com", "clarity.ms", "intercom.io", "intercomcdn.com",
+    "hs-scripts.com", "hs-analytics.net", "hsforms.net", "licdn.com",
+    "ads-twitter.com", "quantserve.com", "newrelic.com", "nr-data.net",
+)
+SETTLE_QUIET_MS    = 750  # card count must hold this long before the page counts as rendered
+SETTLE_TIMEOUT_MS  = 3000 # upper bound on waiting for cards to render or stop changing
+SCROLL_WAIT_MS     = 1000 # upper bound on waiting for growth after each scroll
+LOAD_MORE_WAIT_MS  = 4000 # upper bound on waiting for cards after a "load more" click
+PLATEAU_ROUNDS     = 2    # scroll + load-more rounds without growth before a page is done
+PAGINATION_BUDGET_S = 30  # total time for scrolling, load-more clicks and next pages
+MAX_PAGES          = 50   # numbered/"next" pages followed per portfolio
+BATCH_WORKERS      = 8    # portfolio pages scraped at once in batch mode
+CONTEXT_MAX_USES   = 25   # scrapes served by one warm browser context before it is replaced
+SERVICE_HOST       = "127.0.0.1"
+SERVICE_PORT       = 8790 # --serve listens here
+SERVICE_BROWSERS   = 2    # warm Chromium processes kept by --serve
+PARQUET_ROW_GROUP  = 1000 # rows buffered before a Parquet row group is written
+STATE_DIR = pathlib.Path(os.environ.get("VC_SCRAPER_STATE", pathlib.Path.home() / ".cache/vc-scraper"))
+HTTP_CACHE         = True # keep responses on disk and revalidate them on re-runs
+HTTP_CACHE_TTL     = 6 * 3600           # seconds a cached body is served without asking
+HTTP_CACHE_MAX_BYTES = 200 * 1024 ** 2  # least recently used bodies are evicted past this
+HTTP_CACHE_EVICT_TO = 0.9 # ...down to this share of it, so one eviction pass covers many inserts
+EXTRACTOR_VERSION  = 6    # bump when _analyze_html changes so cached results are ignored
+RESUME             = False # --resume: reuse detail pages resolved by an earlier, interrupted run
+RESUME_MAX_AGE     = 24 * 3600          # seconds a detail-page checkpoint stays usable for --resume
+SITE_PROFILES      = True # replay the strategy that worked for a site last time before rediscovering
+PROFILE_DROP_RATIO = 0.5  # a replay returning fewer than this share of last run's rows is rediscovered
+PLAYWRIGHT_MIN_GAIN = 1.2 # run Playwright over good HTML only if the page suggests this many times more companies
+FIRM_BUDGET_S      = 240  # --budget: seconds one portfolio may take end to end (None: no limit)
+HTTP_ATTEMPTS      = 3    # tries for a page GET that times out, can't connect or gets RETRY_STATUSES
+PAGE_LOAD_ATTEMPTS = 3    # tries for the Playwright navigation to the portfolio page
+GOTO_TIMEOUT_S     = 60   # cap on one Playwright navigation
+RETRY_STATUSES     = {429, 500, 502, 503, 504}
+RETRY_BASE_DELAY   = 1.0  # seconds before the first retry; doubled per attempt, with jitter
+RETRY_MAX_DELAY    = 20.0
+BREAKER            = True # skip portfolio hosts whose page loads keep failing (--no-breaker to disable)
+BREAKER_FAILURES   = 3    # consecutive failed page loads that open a host's breaker
+BREAKER_COOLDOWN   = 15 * 60            # seconds an opened breaker skips the host; doubles while it keeps failing
+BREAKER_MAX_COOLDOWN = 24 * 3600        # cap on the cool-down; failures older than this are forgotten
+METRICS_LOG        = os.environ.get("VC_SCRAPER_METRICS_LOG")  # --metrics-log: one JSON line per scrape ("-" = stderr)
+METRICS_FILE       = None # --metrics-file: Prometheus text file rewritten after every scrape
+PROFILER           = None # --profile: "cprofile" or "pyinstrument", one report per scrape
+PROFILE_DIR        = pathlib.Path("profiles")
 
 # ── stdlib / third-party ─────────────────────────────────────────────
-import csv, html, re
+import argparse, asyncio, contextvars, csv, hashlib, html, io, json, queue, random, re, sqlite3, threading, time
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
-from urllib.parse import urljoin
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse
 
-import requests
-import tldextract
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+# Third-party packages (httpx, tldextract, bs4, lxml, playwright) and the Chromium
+# check are loaded by the stage that first needs them, so `import vc_scraper`, an
+# API-only scrape or `--help` never pays for a browser stack it doesn't use.
 
 # ── helpers ──────────────────────────────────────────────────────────
 def normalize(url: str) -> str:
@@ -65,48 +143,1425 @@ def normalize(url: str) -> str:
     return "https:" + url[2:] if url.startswith("//") else url
 
 def fetch(url: str) -> str:
-    resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=TIMEOUT)
-    resp.raise_for_status()
-    return resp.text
+    return _run_async(_afetch(url)).text
+
+def _host(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+# ── domain resolution ───────────────────────────────────────────────
+# tldextract's default extractor may download the public suffix list on first use,
+# which hangs offline workers. This one only reads the snapshot bundled with the
+# package and never touches the disk cache. Lookups are memoised per hostname, so
+# the thousands of links on a page cost one suffix match per distinct host.
+@lru_cache(maxsize=None)
+def _tld():
+    import tldextract
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+_NETLOC = re.compile(r"^(?:[a-z][a-z0-9+.\-]*:)?//(?:[^@/?#]*@)?(\[[^\]]*\]|[^/?#:]*)", re.IGNORECASE)
+
+def hostname_of(url: str) -> str:
+    """Lower-cased host of ``url``; scheme-less strings are read as ``host/path``."""
+    match = _NETLOC.match(url)
+    host = match.group(1) if match else re.split(r"[/?#:]", url.split("@")[-1], maxsplit=1)[0]
+    return host.strip().rstrip(".").lower()
+
+@lru_cache(maxsize=65536)
+def _domain_of_host(host: str) -> str:
+    return _tld()(host).domain
+
+def domain_of(url: str) -> str:
+    """Registrable label of ``url``: ``"google"`` for ``https://maps.google.co.uk/x``."""
+    return _domain_of_host(hostname_of(url))
+
+# ── instrumentation ─────────────────────────────────────────────────
+# Counters labelled by firm, kept for the life of the process. A span is two of
+# them (seconds and count), so a scrape's own numbers are the difference between
+# its firm's snapshot before and after; that difference is the JSON log line.
+# ``--serve`` exposes the running totals at ``GET /metrics``.
+class Metrics:
+    """Thread-safe counters; ``inc("http_requests_total", firm="av.vc", source="network")``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    @contextmanager
+    def span(self, name: str, firm: str):
+        """Time the block as span ``name``; it is charged even when the block raises."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, firm, time.monotonic() - started)
+
+    def observe(self, name: str, firm: str, seconds: float) -> None:
+        self.inc("span_seconds_total", seconds, firm=firm, span=name)
+        self.inc("spans_total", 1, firm=firm, span=name)
+
+    def snapshot(self, firm: str) -> Dict[Tuple, float]:
+        """This firm's counters, keyed by ``(name, other labels)``."""
+        with self._lock:
+            return {(name, tuple(l for l in labels if l[0] != "firm")): value
+                    for (name, labels), value in self._values.items() if ("firm", firm) in labels}
+
+    def prometheus(self) -> str:
+        """Every counter in the Prometheus text exposition format."""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines, typed = [], set()
+        for (name, labels), value in values:
+            metric = f"vc_scraper_{name}"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            label_text = ",".join(f'{k}="{_label_value(v)}"' for k, v in labels)
+            lines.append(f"{metric}{{{label_text}}} {value:g}" if label_text else f"{metric} {value:g}")
+        return "\n".join(lines) + "\n"
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+METRICS = Metrics()
+_metrics_lock = threading.Lock()
+# The firm whose scrape is running. ``_extract`` sets it, and it follows the work onto
+# the HTTP loop (``_run_async``) and browser threads (``SharedBrowser.call``), so a
+# request is charged to the scrape that made it, whatever host it went to.
+_scrape_firm = contextvars.ContextVar("vc_scraper_firm", default=None)
+
+def _run_summary(before: Dict[Tuple, float], after: Dict[Tuple, float]) -> Dict:
+    """The counters that moved between two snapshots, as a JSON-friendly dict.
+
+    ``http_requests_total{source=network}`` becomes ``{"http_requests": {"network": n}}``;
+    counters without labels besides the firm are plain numbers.
+    """
+    summary: Dict = {}
+    for key in sorted(after):
+        value = after[key] - before.get(key, 0)
+        if not value:
+            continue
+        name, labels = key
+        name = name[:-len("_total")] if name.endswith("_total") else name
+        value = round(value, 3)
+        if labels:
+            summary.setdefault(name, {})[",".join(v for _, v in labels)] = value
+        else:
+            summary[name] = value
+    return summary
+
+def _report_run(firm: str, url: str, method: Optional[str], rows: int, seconds: float,
+                before: Dict[Tuple, float]) -> None:
+    """Count the scrape, then write its JSON log line and the Prometheus file when enabled."""
+    summary = _run_summary(before, METRICS.snapshot(firm))
+    METRICS.inc("scrapes_total", firm=firm, method=method or "none")
+    if not (METRICS_LOG or METRICS_FILE):
+        return
+    record = {"ts": datetime.now(timezone.utc).isoformat(timespec="seconds"), "event": "scrape",
+              "firm": firm, "url": url, "method": method, "rows": rows, "seconds": round(seconds, 3), **summary}
+    with _metrics_lock:
+        try:
+            if METRICS_LOG == "-":
+                print(json.dumps(record), file=sys.stderr, flush=True)
+            elif METRICS_LOG:
+                with open(METRICS_LOG, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+            if METRICS_FILE:
+                tmp = Path(f"{METRICS_FILE}.tmp")
+                tmp.write_text(METRICS.prometheus(), encoding="utf-8")
+                tmp.replace(METRICS_FILE)
+        except OSError as e:
+            print(f"⚠️  Could not write metrics: {e}")
+
+_SAFE_NAME = re.compile(r"[^\w.-]")
+
+@contextmanager
+def _profiled(firm: str):
+    """Profile the calling thread with PROFILER while the block runs, one report per scrape.
+
+    Only this thread is sampled: Playwright work on a ``SharedBrowser`` thread and
+    response handling on the HTTP loop show up as the time spent waiting for them.
+    """
+    if not PROFILER:
+        yield
+        return
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    stem = PROFILE_DIR / f"{_SAFE_NAME.sub('_', firm)}-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}"
+    if PROFILER == "pyinstrument":
+        from pyinstrument import Profiler
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            Path(f"{stem}.html").write_text(profiler.output_html(), encoding="utf-8")
+            print(f"ℹ️  Profile written to {stem}.html")
+    else:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(f"{stem}.pstats")
+            print(f"ℹ️  Profile written to {stem}.pstats")
+
+def _count_http(url: str, source: str, nbytes: int = 0) -> None:
+    """One response for ``url``: ``source`` is "network", "revalidated" (a 304) or "cache".
+
+    Charged to the running scrape's firm; outside a scrape, to the firm of ``url``'s host.
+    """
+    firm = _scrape_firm.get() or firm_of(url)
+    METRICS.inc("http_requests_total", firm=firm, source=source)
+    if nbytes:
+        METRICS.inc("http_bytes_total", nbytes, firm=firm)
+
+class _Traced:
+    """A Playwright page or context whose method calls are counted as browser round trips.
+
+    Pages it opens are traced too. Event-listener bookkeeping stays in-process and isn't counted.
+    """
+    _LOCAL = {"on", "once", "remove_listener", "is_closed"}
+
+    def __init__(self, target, firm: str):
+        self._target = target
+        self._firm = firm
+
+    def __getattr__(self, name: str):
+        value = getattr(self._target, name)
+        if name.startswith("_") or name in self._LOCAL or not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            METRICS.inc("browser_calls_total", firm=self._firm)
+            result = value(*args, **kwargs)
+            return _Traced(result, self._firm) if name == "new_page" else result
+        return call
+
+# ── local state ─────────────────────────────────────────────────────
+# One SQLite file under STATE_DIR holds everything that survives between runs.
+# It is optional: when the directory is not writable the scraper just runs cold.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT,
+    body_hash TEXT, size INTEGER, fetched_at REAL, used_at REAL, headers TEXT
+);
+CREATE INDEX IF NOT EXISTS http_cache_lru ON http_cache (used_at, size);
+CREATE TABLE IF NOT EXISTS page_rows (
+    firm TEXT, page TEXT, company TEXT, url TEXT, PRIMARY KEY (firm, page, company, url)
+);
+CREATE TABLE IF NOT EXISTS detail_links (
+    firm TEXT, href TEXT, name TEXT, website TEXT, resolved_at REAL, PRIMARY KEY (firm, href)
+);
+CREATE INDEX IF NOT EXISTS detail_links_href ON detail_links (href, resolved_at);
+CREATE INDEX IF NOT EXISTS detail_links_name ON detail_links (name, resolved_at);
+CREATE TABLE IF NOT EXISTS extractions (
+    body_hash TEXT, url TEXT, version INTEGER, result TEXT, used_at REAL,
+    PRIMARY KEY (body_hash, url, version)
+);
+CREATE TABLE IF NOT EXISTS page_profiles (
+    firm TEXT, page TEXT, strategy TEXT, endpoint TEXT,
+    selectors TEXT, wait TEXT, rows INTEGER, updated_at REAL, PRIMARY KEY (firm, page)
+);
+CREATE TABLE IF NOT EXISTS host_health (
+    host TEXT PRIMARY KEY, failures INTEGER, opened_until REAL, failed_at REAL
+);
+"""
+_db_conn: Optional[sqlite3.Connection] = None
+_db_lock = threading.RLock()
+_db_failed = False
+
+def _db(sql: str, params: tuple = ()) -> list:
+    """Run one statement against the state database; returns its rows ([] if unavailable)."""
+    global _db_conn, _db_failed
+    with _db_lock:
+        if _db_failed:
+            return []
+        try:
+            if _db_conn is None:
+                STATE_DIR.mkdir(parents=True, exist_ok=True)
+                # several --processes workers share the file: WAL lets readers run during a
+                # write, and the timeout makes writers queue instead of failing
+                _db_conn = sqlite3.connect(str(STATE_DIR / "state.sqlite"), timeout=30, check_same_thread=False)
+                _db_conn.execute("PRAGMA journal_mode=WAL")
+                _db_conn.executescript(_SCHEMA)
+            with _db_conn:
+                return _db_conn.execute(sql, params).fetchall()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Local state disabled: {e}")
+            _db_failed = True
+            return []
+
+def _cached_extraction(body_hash: str, url: str) -> Optional[Dict]:
+    row = _db("SELECT result FROM extractions WHERE body_hash = ? AND url = ? AND version = ?",
+              (body_hash, url, EXTRACTOR_VERSION))
+    if not row:
+        return None
+    _db("UPDATE extractions SET used_at = ? WHERE body_hash = ? AND url = ? AND version = ?",
+        (time.time(), body_hash, url, EXTRACTOR_VERSION))
+    return json.loads(row[0][0])
+
+def _store_extraction(body_hash: str, url: str, result: Dict) -> None:
+    if HTTP_CACHE:
+        _db("INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?)",
+            (body_hash, url, EXTRACTOR_VERSION, json.dumps(result), time.time()))
+
+class DetailLinks(dict):
+    """Detail-page href -> website pairs for one firm, checkpointed as each one is set.
+
+    A crawl that dies part-way leaves every page it resolved in ``detail_links``, where
+    ``known_links`` (``--resume`` and incremental runs) picks them up again. Only those
+    runs reuse stored resolutions: ``since`` is the oldest one they accept, from this
+    firm or, through ``shared``, any other; a fresh ``DetailLinks`` reuses nothing.
+    """
+
+    def __init__(self, firm: str, pairs=(), since: Optional[float] = None):
+        super().__init__(pairs)
+        self.firm, self.since = firm, since
+
+    def __setitem__(self, href: str, website: str) -> None:
+        self.add({"href": href}, website)
+
+    def add(self, company: Dict[str, str], website: str) -> None:
+        """Record ``company``'s website, keeping its name so other firms can find it."""
+        super().__setitem__(company['href'], website)
+        _db("INSERT OR REPLACE INTO detail_links VALUES (?, ?, ?, ?, ?)",
+            (self.firm, company['href'], _shared_name(company), website, time.time()))
+
+    def shared(self, company: Dict[str, str]) -> Optional[str]:
+        """A website another firm resolved for the same detail page or name, no older than ``since``."""
+        if self.since is None:
+            return None
+        found = _db("SELECT website FROM detail_links WHERE (href = ? OR name = ?) AND resolved_at >= ? "
+                    "ORDER BY resolved_at DESC LIMIT 1", (company['href'], _shared_name(company), self.since))
+        return found[0][0] if found else None
+
+def known_links(firm: str, max_age: Optional[float] = None) -> DetailLinks:
+    """Detail-page pairs resolved for ``firm`` on earlier runs, optionally only recent ones."""
+    since = 0 if max_age is None else time.time() - max_age
+    return DetailLinks(firm, _db("SELECT href, website FROM detail_links WHERE firm = ? AND resolved_at >= ?",
+                                 (firm, since)), since)
+
+def _evict_detail_links() -> None:
+    _db("DELETE FROM detail_links WHERE resolved_at < ?", (time.time() - DETAIL_LINKS_TTL,))
+    _db("DELETE FROM detail_links WHERE rowid NOT IN "
+        "(SELECT rowid FROM detail_links ORDER BY resolved_at DESC LIMIT ?)", (DETAIL_LINKS_MAX_ROWS,))
+
+# ── time budgets, retries and circuit breaker ───────────────────────
+# Each scrape gets FIRM_BUDGET_S seconds. A stage takes its timeouts from what is
+# left (a share of it, under the stage's own cap), so a dead or crawling site gives
+# up inside its budget instead of stacking fixed waits, and a batch worker moves on
+# to the next firm. Retries wait an exponential, jittered delay, and only when the
+# budget still covers it. Hosts whose page loads keep failing are remembered in the
+# state store and skipped by later scrapes until their cool-down ends. The HTTP
+# fetch and the Playwright load only note their outcome on the budget; ``_extract``
+# settles it once, so one scrape counts at most one failure however many loaders
+# and retries gave up.
+class Budget:
+    """Wall-clock budget for one scrape; ``Budget()`` never runs out.
+
+    ``loaded`` is ``True`` once the portfolio page loaded, ``False`` if a load failed
+    (and none succeeded) before the budget ran out, ``None`` if nothing tried.
+    ``partial`` is set by any stage that had to stop before it had every row.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires = None if not seconds else time.monotonic() + seconds
+        self.loaded: Optional[bool] = None
+        self.partial = False
+
+    def page_loaded(self, ok: bool) -> None:
+        self.loaded = ok or bool(self.loaded)
+
+    def remaining(self) -> float:
+        return float("inf") if self.expires is None else max(0.0, self.expires - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float, share: float = 1.0) -> float:
+        """Seconds a stage may wait: ``share`` of the time left, at most ``cap``."""
+        return min(cap, self.remaining() * share)
+
+def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Delay before retry ``attempt`` (1 for the first): exponential with equal jitter.
+
+    A numeric ``Retry-After`` header value raises the delay, up to RETRY_MAX_DELAY.
+    """
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    delay = random.uniform(delay / 2, delay)
+    if retry_after and retry_after.strip().isdigit():
+        delay = max(delay, min(RETRY_MAX_DELAY, float(retry_after)))
+    return delay
+
+def breaker_open_until(host: str) -> Optional[float]:
+    """When ``host``'s breaker closes again (epoch seconds), or ``None`` if it is closed."""
+    if not BREAKER:
+        return None
+    found = _db("SELECT opened_until FROM host_health WHERE host = ?", (host,))
+    opened_until = found[0][0] if found else None
+    return opened_until if opened_until and opened_until > time.time() else None
+
+def _host_failed(host: str) -> None:
+    """Count a failed page load; BREAKER_FAILURES in a row open the breaker."""
+    now = time.time()
+    found = _db("SELECT failures, failed_at FROM host_health WHERE host = ?", (host,))
+    failures = found[0][0] + 1 if found and now - found[0][1] < BREAKER_MAX_COOLDOWN else 1
+    opened_until = None
+    if failures >= BREAKER_FAILURES:
+        opened_until = now + min(BREAKER_MAX_COOLDOWN, BREAKER_COOLDOWN * 2 ** (failures - BREAKER_FAILURES))
+        print(f"⚠️  {host} failed {failures} times in a row - skipping it for "
+              f"{(opened_until - now) / 60:.0f} min")
+    _db("INSERT OR REPLACE INTO host_health VALUES (?, ?, ?, ?)", (host, failures, opened_until, now))
+
+def _host_ok(host: str) -> None:
+    _db("DELETE FROM host_health WHERE host = ?", (host,))
+
+# ── async HTTP layer ────────────────────────────────────────────────
+# Every HTTP request goes through one pooled (HTTP/2 when ``h2`` is installed)
+# client living on a background event loop, so sync callers on any thread share
+# connections and can fan several requests out at once.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_client = None  # httpx.AsyncClient, created on first use
+
+async def _as_firm(coro, firm: Optional[str]):
+    _scrape_firm.set(firm)  # the task's own context; tasks it gathers inherit it
+    return await coro
+
+def _run_async(coro):
+    """Run ``coro`` on the shared HTTP event loop and block until it finishes."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="vc-scraper-http", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(_as_firm(coro, _scrape_firm.get()), _loop).result()
+
+def _http():
+    """The shared ``httpx.AsyncClient``; only call this from coroutines running on the HTTP loop."""
+    global _client
+    if _client is None:
+        import httpx
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        _client = httpx.AsyncClient(
+            http2=http2,
+            headers={"User-Agent": USER_AGENT},
+            timeout=httpx.Timeout(TIMEOUT[1], connect=TIMEOUT[0]),
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+            follow_redirects=True,
+        )
+    return _client
+
+class Fetched(NamedTuple):
+    status: int
+    text: str
+    body_hash: str
+    from_cache: bool          # body came from the HTTP cache (fresh hit or 304)
+    headers: Dict[str, str]   # lower-cased; cached responses keep only CACHED_HEADERS
+
+CACHED_HEADERS = ("content-type", "x-wp-total", "x-wp-totalpages")
+
+_cache_bytes: Optional[int] = None  # running size of http_cache, synced from the table on eviction
+
+def _cache_added(size: int) -> None:
+    """Account for a newly cached body; evict only once the cache has outgrown HTTP_CACHE_MAX_BYTES.
+
+    The running total is per process (other --processes workers write too), so it is
+    re-read from the table whenever it claims the limit is reached.
+    """
+    global _cache_bytes
+    with _db_lock:
+        if _cache_bytes is None:
+            _cache_bytes = (_db("SELECT COALESCE(SUM(size), 0) FROM http_cache") or [(0,)])[0][0]
+        else:
+            _cache_bytes += size
+        if _cache_bytes > HTTP_CACHE_MAX_BYTES:
+            _cache_bytes = _cache_evict()
+
+def _cache_evict() -> int:
+    """Drop least recently used cache entries down to HTTP_CACHE_EVICT_TO of the limit; returns the new size."""
+    rows = _db("SELECT used_at, size FROM http_cache ORDER BY used_at")
+    total = sum(size for _, size in rows)
+    if total <= HTTP_CACHE_MAX_BYTES:
+        return total
+    cutoff = None
+    for used_at, size in rows:
+        if total <= HTTP_CACHE_MAX_BYTES * HTTP_CACHE_EVICT_TO:
+            break
+        total -= size
+        cutoff = used_at
+    _db("DELETE FROM http_cache WHERE used_at <= ?", (cutoff,))
+    _db("DELETE FROM extractions WHERE body_hash NOT IN (SELECT body_hash FROM http_cache)")
+    return total
+
+async def _aget(url: str, timeout: Optional[float] = None) -> Fetched:
+    """GET through the on-disk cache.
+
+    Bodies younger than HTTP_CACHE_TTL are served without a request; older ones are
+    revalidated with If-None-Match / If-Modified-Since and reused on a 304.
+    """
+    cached = _db("SELECT etag, last_modified, body, body_hash, fetched_at, headers FROM http_cache WHERE url = ?",
+                 (url,)) if HTTP_CACHE else []
+    now = time.time()
+    headers = {}
+    if cached:
+        etag, last_modified, body, body_hash, fetched_at, kept = cached[0]
+        kept = json.loads(kept or "{}")
+        if now - fetched_at < HTTP_CACHE_TTL:
+            _db("UPDATE http_cache SET used_at = ? WHERE url = ?", (now, url))
+            _count_http(url, "cache")
+            return Fetched(200, body, body_hash, True, kept)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    limits = {}
+    if timeout is not None:
+        import httpx
+        limits["timeout"] = httpx.Timeout(timeout, connect=min(TIMEOUT[0], timeout))
+    resp = await _http().get(url, headers=headers, **limits)
+    if resp.status_code == 304 and cached:
+        _db("UPDATE http_cache SET fetched_at = ?, used_at = ? WHERE url = ?", (now, now, url))
+        _count_http(url, "revalidated")
+        return Fetched(200, body, body_hash, True, kept)
+
+    _count_http(url, "network", len(resp.content))
+    text = resp.text
+    body_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    response_headers = {k.lower(): v for k, v in resp.headers.items()}
+    if HTTP_CACHE and resp.status_code == 200:
+        kept = {k: response_headers[k] for k in CACHED_HEADERS if k in response_headers}
+        _db("INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, resp.headers.get("etag"), resp.headers.get("last-modified"), text,
+             body_hash, len(resp.content), now, now, json.dumps(kept)))
+        _cache_added(len(resp.content))
+    return Fetched(resp.status_code, text, body_hash, False, response_headers)
+
+async def _afetch(url: str, budget: Optional[Budget] = None) -> Fetched:
+    """GET a page that must load, within ``budget``.
+
+    Timeouts, connection errors and RETRY_STATUSES are retried up to HTTP_ATTEMPTS
+    times with backoff. The outcome is noted on ``budget`` for the circuit breaker,
+    and any status of 400 or above that is left raises ``httpx.HTTPStatusError``.
+    """
+    import httpx
+    budget = budget or Budget()
+    for attempt in range(1, HTTP_ATTEMPTS + 1):
+        retry_after = None
+        try:
+            page = await _aget(url, timeout=budget.timeout(TIMEOUT[1], share=0.25))
+            if page.status < 400:
+                budget.page_loaded(True)
+                return page
+            error = httpx.HTTPStatusError(f"{page.status} error for {url}", request=httpx.Request("GET", url),
+                                          response=httpx.Response(page.status))
+            if page.status not in RETRY_STATUSES:
+                raise error
+            retry_after = page.headers.get("retry-after")
+        except httpx.TransportError as e:
+            error = e
+        delay = _backoff(attempt, retry_after)
+        if attempt == HTTP_ATTEMPTS or budget.remaining() < delay + 1:
+            break
+        print(f"⚠️  {url}: {str(error) or type(error).__name__} - retrying in {delay:.1f}s")
+        METRICS.inc("retries_total", firm=firm_of(url), kind="http")
+        await asyncio.sleep(delay)
+    budget.page_loaded(False)
+    raise error
+
+def _rows_from_api(api_data) -> List[Tuple[str, str]]:
+    """Turn a WordPress/JSON API listing into (name, website) rows."""
+    rows, seen_urls = [], set()
+    if not isinstance(api_data, list):
+        return rows
+    for item in api_data:
+        if isinstance(item, dict):
+            name = ""
+            website = ""
+
+            # Try different field names for company name
+            for name_field in ["title", "name", "company_name", "company"]:
+                if name_field in item:
+                    if isinstance(item[name_field], dict) and "rendered" in item[name_field]:
+                        name = html.unescape(item[name_field]["rendered"]).strip()
+                    elif isinstance(item[name_field], str):
+                        name = item[name_field].strip()
+                    break
+
+            # Try different field names for website; an ACF company_website beats the post permalink
+            acf = item.get("acf")
+            if isinstance(acf, dict) and isinstance(acf.get("company_website"), str):
+                website = acf["company_website"].strip()
+            if not website:
+                for url_field in ["website", "company_website", "url", "link"]:
+                    if url_field in item:
+                        if isinstance(item[url_field], str):
+                            website = item[url_field]
+                        break
+
+            if name and len(name) > 1:
+                final_url = website or f"https://www.google.com/search?q={name.replace(' ', '+')}+company"
+                if final_url not in seen_urls:
+                    rows.append((name, final_url))
+                    seen_urls.add(final_url)
+    return rows
+
+def _merge_rows(pages: List[List[Tuple[str, str]]]) -> List[Tuple[str, str]]:
+    """Concatenate per-page rows in page order, keeping the first row for each URL."""
+    rows, seen_urls = [], set()
+    for page_rows in pages:
+        for name, website in page_rows:
+            if website not in seen_urls:
+                rows.append((name, website))
+                seen_urls.add(website)
+    return rows
+
+def _wp_page_url(endpoint: str, page: int, bare: bool = False) -> str:
+    """Listing page ``page``; ``bare`` drops ``per_page``/``_fields`` for endpoints that reject them."""
+    if bare:
+        return f"{endpoint}?{urlencode({'page': page})}"
+    return f"{endpoint}?{urlencode({'per_page': WP_PER_PAGE, 'page': page, '_fields': WP_FIELDS})}"
+
+async def _awp_collection(endpoint: str, budget: Optional[Budget] = None) -> List[Tuple[str, str]]:
+    """Every item of a WordPress REST collection.
+
+    Page 1 is requested with ``per_page``/``_fields``; its ``X-WP-TotalPages`` header
+    says how many more to fetch, and those are requested together (at most
+    WP_PAGE_CONCURRENCY at once). Each page is turned into rows as soon as it arrives.
+    An endpoint that rejects those parameters is paged with ``?page=N`` alone.
+    """
+    budget = budget or Budget()
+    timeout = budget.timeout(API_PROBE_TIMEOUT, share=0.25)
+    bare = False
+    first = await _aget(_wp_page_url(endpoint, 1), timeout=timeout)
+    if first.status == 400:  # endpoint rejects the paging / projection parameters
+        METRICS.inc("retries_total", firm=firm_of(endpoint), kind="wp_params")
+        bare = True
+        first = await _aget(endpoint, timeout=timeout)
+    if first.status != 200:
+        return []
+    try:
+        rows = _rows_from_api(json.loads(first.text))
+    except ValueError:
+        return []
+    try:
+        total_pages = int(first.headers.get("x-wp-totalpages", "1"))
+    except ValueError:
+        total_pages = 1
+    if not rows or total_pages <= 1:
+        return rows
+
+    print(f"ℹ️  WordPress API lists {first.headers.get('x-wp-total', '?')} items over {total_pages} pages")
+    limit = asyncio.Semaphore(WP_PAGE_CONCURRENCY)
+
+    async def page_rows(page: int) -> List[Tuple[str, str]]:
+        async with limit:
+            resp = await _aget(_wp_page_url(endpoint, page, bare))
+        if resp.status != 200:
+            print(f"⚠️  WordPress API page {page} failed with HTTP {resp.status}")
+            budget.partial = True
+            return []
+        try:
+            return _rows_from_api(json.loads(resp.text))
+        except ValueError:
+            return []
+
+    rest = await asyncio.gather(*(page_rows(page) for page in range(2, total_pages + 1)))
+    return _merge_rows([rows, *rest])
+
+async def _aprobe_api(endpoint: str, budget: Optional[Budget] = None) -> List[Tuple[str, str]]:
+    if "/wp-json/" in endpoint:
+        return await _awp_collection(endpoint, budget)
+    resp = await _aget(endpoint, timeout=(budget or Budget()).timeout(API_PROBE_TIMEOUT, share=0.25))
+    if resp.status != 200:
+        return []
+    try:
+        return _rows_from_api(json.loads(resp.text))
+    except ValueError:
+        return []
+
+async def _aprobe_and_fetch(url: str, endpoints: List[str], hints: Optional[Dict] = None,
+                            budget: Optional[Budget] = None):
+    """Probe the JSON APIs and GET the page together; the first API with rows wins.
+
+    Returns ``(api_rows, page, error)``. When an API answers, the page download and
+    the remaining probes are cancelled, ``page`` is ``None`` and the endpoint is
+    recorded as ``hints["endpoint"]``; otherwise ``page`` (a ``Fetched``, or the
+    exception that stopped it) comes from the page GET. ``budget`` bounds every request.
+    """
+    hints = {} if hints is None else hints
+    page = asyncio.ensure_future(_afetch(url, budget))
+    probes = {asyncio.ensure_future(_aprobe_api(e, budget)): e for e in endpoints}
+    try:
+        waiting = set(probes)
+        while waiting:
+            done, waiting = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.exception() and task.result():
+                    print(f"ℹ️  Using WordPress/API endpoint {probes[task]}")
+                    hints["endpoint"] = probes[task]
+                    return task.result(), None, None
+        try:
+            return [], await page, None
+        except Exception as e:
+            return [], None, e
+    finally:
+        for task in [page, *probes]:
+            task.cancel()
+
+# ── in-page extraction ──────────────────────────────────────────────
+# Cards and links are read with one page.evaluate() per page instead of a
+# query_selector_all / get_attribute / inner_text round trip per element.
+BULK_DOM_EXTRACTION = True  # False: read elements one IPC call at a time (debugging)
+CARD_SELECTORS = [
+    '[class*="company-card"]',
+    '[class*="CompanyCard"]',
+    '[class*="portfolio-item"]',
+    '[class*="company-logo"]',
+    '[data-testid*="company"]',
+    '[data-testid*="portfolio"]',
+    '[id*="company"]',
+    '[id*="portfolio"]',
+    '.company-card',
+    '[class*="company"]',
+    '[class*="portfolio-item"]',
+    '.grid-item',
+    '.portfolio-card',
+    'a[href*="/company/"]',
+    'a[href*="/portfolio/"]',
+    'a[href*="?company="]',
+    'div[role="listitem"]'
+]
+
+# For each selector: null if it is invalid, else one [href, innerText, [inner <a> hrefs]]
+# per match, where href is the element's own href or that of its first inner <a>.
+_COLLECT_CARDS_JS = """
+selectors => selectors.map(selector => {
+    let elements;
+    try { elements = document.querySelectorAll(selector); } catch (e) { return null; }
+    return Array.from(elements, el => {
+        const links = Array.from(el.querySelectorAll('a'), a => a.getAttribute('href'));
+        const first = el.querySelector('a');
+        return [el.getAttribute('href') || (first && first.getAttribute('href')),
+                el.innerText || '', links];
+    });
+})
+"""
+
+_COLLECT_LINKS_JS = """
+selectors => selectors.map(selector => {
+    try {
+        return Array.from(document.querySelectorAll(selector), a => a.getAttribute('href'));
+    } catch (e) { return []; }
+})
+"""
+
+def _collect_cards(page, selectors: List[str] = CARD_SELECTORS,
+                   matched: Optional[Counter] = None) -> List[Dict]:
+    """Elements matching ``selectors`` as ``{"href", "text", "links"}`` records, selector by selector.
+
+    Per-selector match counts are added to ``matched`` when given.
+    """
+    if BULK_DOM_EXTRACTION:
+        try:
+            matches = page.evaluate(_COLLECT_CARDS_JS, selectors)
+        except Exception as e:
+            print(f"⚠️  Bulk card extraction failed: {e}")
+            matches = [None] * len(selectors)
+    else:
+        matches = []
+        for selector in selectors:
+            try:
+                cards = []
+                for element in page.query_selector_all(selector):
+                    links = [link.get_attribute('href') for link in element.query_selector_all('a')]
+                    first = element.query_selector('a')
+                    href = element.get_attribute('href') or (first.get_attribute('href') if first else None)
+                    cards.append([href, element.inner_text(), links])
+                matches.append(cards)
+            except Exception:
+                matches.append(None)
+
+    records = []
+    for selector, cards in zip(selectors, matches):
+        if cards is None:
+            print(f"⚠️  Selector {selector} failed")
+        elif cards:
+            print(f"Found {len(cards)} elements with selector: {selector}")
+            if matched is not None:
+                matched[selector] += len(cards)
+            records.extend({"href": href, "text": text, "links": links} for href, text, links in cards)
+    return records
+
+# ── page loading ────────────────────────────────────────────────────
+# Instead of fixed sleeps the page is polled inside the browser: waits end as soon as
+# the portfolio cards stop changing (or the page grows after a scroll).
+_CARD_UNION = ", ".join(CARD_SELECTORS)
+
+_SETTLE_JS = """
+([selector, quietMs, timeoutMs]) => new Promise(resolve => {
+    const count = () => document.querySelectorAll(selector).length;
+    const start = Date.now();
+    let last = count(), changed = start;
+    const timer = setInterval(() => {
+        const now = Date.now(), current = count();
+        if (current !== last) { last = current; changed = now; }
+        if ((current > 0 && now - changed >= quietMs) || now - start >= timeoutMs) {
+            clearInterval(timer);
+            resolve(current);
+        }
+    }, 100);
+})
+"""
+
+_SCROLL_JS = """
+([selector, timeoutMs]) => new Promise(resolve => {
+    const height = () => document.body ? document.body.scrollHeight : 0;
+    const count = () => document.querySelectorAll(selector).length;
+    const before = [height(), count()];
+    window.scrollTo(0, height());
+    const start = Date.now();
+    const timer = setInterval(() => {
+        const now = [height(), count()];
+        if (now[0] !== before[0] || now[1] !== before[1] || Date.now() - start >= timeoutMs) {
+            clearInterval(timer);
+            resolve(now);
+        }
+    }, 50);
+})
+"""
+
+_LOAD_MORE_JS = """
+([selector, timeoutMs]) => new Promise(resolve => {
+    const label = /^\\s*(load|show|view|see)\\s+(more|all)\\b/i;
+    const leavesPage = el => el.tagName === 'A' && /^https?:/i.test(el.getAttribute('href') || '')
+        && el.href.split('#')[0] !== location.href.split('#')[0];
+    const button = Array.from(document.querySelectorAll('button, a, [role="button"]')).find(el =>
+        label.test(el.innerText || '') && el.offsetParent !== null && !el.disabled
+        && el.getAttribute('aria-disabled') !== 'true' && !leavesPage(el));
+    if (!button) return resolve(null);
+    const count = () => document.querySelectorAll(selector).length;
+    const before = count(), start = Date.now();
+    button.scrollIntoView({block: 'center'});
+    button.click();
+    const timer = setInterval(() => {
+        const added = count() - before;
+        if (added !== 0 || Date.now() - start >= timeoutMs) {
+            clearInterval(timer);
+            resolve(added);
+        }
+    }, 100);
+})
+"""
+
+# Finds the control leading to the next page of results and tags it for _CLICK_NEXT_JS.
+# Returns null when there is none, {href} when it is a link to another URL, {href: null}
+# when it has to be clicked (buttons, "#" links, client-side routers).
+_NEXT_PAGE_JS = """
+() => {
+    const usable = el => el && el.offsetParent !== null && !el.disabled
+        && el.getAttribute('aria-disabled') !== 'true' && !/disabled/i.test(el.className || '');
+    let next = null;
+    for (const selector of ['a[rel="next"]', '[class*="pagination"] [class*="next"]',
+                            'a[aria-label*="next" i]', 'button[aria-label*="next" i]',
+                            'a[class*="next"]', 'button[class*="next"]']) {
+        next = Array.from(document.querySelectorAll(selector)).find(usable);
+        if (next) break;
+    }
+    if (!next) {
+        const current = document.querySelector(
+            '[class*="pagination"] [aria-current="page"], [class*="pagination"] .active, [class*="pagination"] .current');
+        const number = current && parseInt(current.innerText, 10);
+        if (number) {
+            const container = current.closest('[class*="pagination"]');
+            next = Array.from(container.querySelectorAll('a, button')).find(
+                el => el.innerText.trim() === String(number + 1) && usable(el));
+        }
+    }
+    if (!next) return null;
+    next = next.closest('a, button') || next;
+    document.querySelectorAll('[data-vc-next]').forEach(el => el.removeAttribute('data-vc-next'));
+    next.setAttribute('data-vc-next', '');
+    const href = next.tagName === 'A' && /^https?:/i.test(next.href) ? next.href.split('#')[0] : null;
+    return {href: href && href !== location.href.split('#')[0] ? href : null};
+}
+"""
+
+_CLICK_NEXT_JS = """
+([selector, timeoutMs]) => new Promise(resolve => {
+    const signature = () => {
+        const cards = document.querySelectorAll(selector);
+        return cards.length + '|' + Array.from(cards).slice(0, 3).map(el => el.innerText).join('|');
+    };
+    const next = document.querySelector('[data-vc-next]');
+    if (!next) return resolve(false);
+    const before = signature(), start = Date.now();
+    next.click();
+    const timer = setInterval(() => {
+        const changed = signature() !== before;
+        if (changed || Date.now() - start >= timeoutMs) {
+            clearInterval(timer);
+            resolve(changed);
+        }
+    }, 100);
+})
+"""
+
+def _block_resources(context) -> Counter:
+    """Abort images, media, fonts and tracker requests in ``context``; returns live abort counts."""
+    blocked = Counter()
+
+    def handle(route):
+        request = route.request
+        host = _host(request.url)
+        if request.resource_type in BLOCK_RESOURCE_TYPES:
+            blocked[request.resource_type] += 1
+            return route.abort()
+        if any(host == h or host.endswith("." + h) for h in BLOCK_HOSTS):
+            blocked["tracker"] += 1
+            return route.abort()
+        return route.continue_()
+
+    context.route("**/*", handle)
+    return blocked
+
+def _wait_for_cards(page) -> int:
+    """Wait until the number of portfolio cards stops changing; returns the final count."""
+    return page.evaluate(_SETTLE_JS, [_CARD_UNION, SETTLE_QUIET_MS, SETTLE_TIMEOUT_MS])
+
+def _remaining_ms(deadline: float, cap: int) -> int:
+    return max(0, min(cap, int((deadline - time.monotonic()) * 1000)))
+
+def _expand_page(page, deadline: float) -> int:
+    """Scroll to the bottom and click "load more" until the card count plateaus.
+
+    A round that neither grows the page nor finds a load-more button counts towards
+    PLATEAU_ROUNDS; the loop also stops at ``deadline``. Returns the final card count.
+    """
+    height, count, plateau, clicks = -1, -1, 0, 0
+    while plateau < PLATEAU_ROUNDS and time.monotonic() < deadline:
+        new_height, new_count = page.evaluate(_SCROLL_JS, [_CARD_UNION, _remaining_ms(deadline, SCROLL_WAIT_MS)])
+        grew = new_height != height or new_count != count
+        if not grew:
+            added = page.evaluate(_LOAD_MORE_JS, [_CARD_UNION, _remaining_ms(deadline, LOAD_MORE_WAIT_MS)])
+            if added is not None:
+                clicks += 1
+                grew = added > 0
+        plateau = 0 if grew else plateau + 1
+        height, count = new_height, new_count
+    if time.monotonic() >= deadline:
+        print("⚠️  Pagination time budget used up; continuing with what has loaded")
+    print(f"ℹ️  {count} cards after scrolling ({clicks} load-more clicks)")
+    return count
+
+def _collect_paginated(page, deadline: float, hints: Optional[Dict] = None,
+                       budget: Optional[Budget] = None) -> List[Dict]:
+    """``_collect_cards`` over the current page and every following numbered / "next" page.
+
+    ``hints["selectors"]`` (from a site profile) are used instead of CARD_SELECTORS unless
+    they match nothing on the first page; the selectors that matched are written back.
+    A following page that fails to load ends the pass with the cards collected so far,
+    and marks ``budget`` partial.
+    """
+    hints = {} if hints is None else hints
+    budget = budget or Budget()
+    selectors = hints.get("selectors") or CARD_SELECTORS
+    matched = Counter()
+    cards = _collect_cards(page, selectors, matched)
+    if not cards and selectors != CARD_SELECTORS:
+        print("ℹ️  Remembered card selectors matched nothing - trying all of them")
+        selectors = CARD_SELECTORS
+        cards = _collect_cards(page, selectors, matched)
+    visited = {page.url.split('#')[0]}
+    for number in range(2, MAX_PAGES + 1):
+        if time.monotonic() >= deadline:
+            print("⚠️  Pagination time budget used up; not following further pages")
+            break
+        try:
+            target = page.evaluate(_NEXT_PAGE_JS)
+            if not target:
+                break
+            if target['href']:
+                if target['href'] in visited:
+                    break
+                visited.add(target['href'])
+                timeout_ms = _remaining_ms(deadline, GOTO_TIMEOUT_S * 1000)
+                if not timeout_ms:  # 0 would mean no timeout at all
+                    break
+                page.goto(target['href'], timeout=timeout_ms, wait_until='domcontentloaded')
+                _wait_for_cards(page)
+            elif not page.evaluate(_CLICK_NEXT_JS, [_CARD_UNION, _remaining_ms(deadline, LOAD_MORE_WAIT_MS)]):
+                break
+            _expand_page(page, deadline)
+            print(f"ℹ️  Page {number}:")
+            cards.extend(_collect_cards(page, selectors, matched))
+        except Exception as e:
+            print(f"⚠️  Could not load page {number}: {e} - keeping the {len(cards)} cards found so far")
+            budget.partial = True
+            break
+    hints["selectors"] = [selector for selector in selectors if matched[selector]]
+    return cards
+
+class _PhaseClock:
+    """Wall time per named phase; ``lap(name)`` charges the time since the previous lap to ``name``.
+
+    Each lap is also recorded as the span ``playwright.<name>`` for ``firm``.
+    """
+
+    def __init__(self, firm: str = ""):
+        self.timings: Dict[str, float] = {}
+        self.firm = firm
+        self._mark = time.monotonic()
+
+    def lap(self, phase: str) -> None:
+        now = time.monotonic()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._mark
+        METRICS.observe(f"playwright.{phase}", self.firm, now - self._mark)
+        self._mark = now
+
+    def summary(self) -> str:
+        return " · ".join(f"{phase} {seconds:.1f}s" for phase, seconds in self.timings.items())
+
+# ── detail pages ────────────────────────────────────────────────────
+WEBSITE_SELECTORS = [
+    'a[href*="://"][target="_blank"]',
+    'a[href*="www."]',
+    'a[href*="http"]',
+    '[class*="website"] a',
+    '[class*="link"] a',
+    'a[class*="website"]',
+    'a[class*="link"]'
+]
+
+def _is_website(href: Optional[str], original_domain: str) -> bool:
+    return bool(href) and not any(x in href.lower() for x in [
+        'linkedin.com', 'twitter.com', 'facebook.com',
+        'instagram.com', 'youtube.com', 'medium.com',
+        'github.com', 'crunchbase.com', original_domain
+    ])
+
+def _find_website(detail_page, original_domain: str) -> Optional[str]:
+    """Return the first outbound link on a company detail page that looks like its website."""
+    if BULK_DOM_EXTRACTION:
+        candidates = detail_page.evaluate(_COLLECT_LINKS_JS, WEBSITE_SELECTORS)
+    else:
+        candidates = []
+        for selector in WEBSITE_SELECTORS:
+            try:
+                candidates.append([link.get_attribute('href') for link in detail_page.query_selector_all(selector)])
+            except Exception:
+                candidates.append([])
+    for hrefs in candidates:
+        for href in hrefs:
+            if _is_website(href, original_domain):
+                return href
+    return None
+
+# Co-invested companies show up on many portfolios, and many cards link through the
+# same redirectors, so runs that reuse stored detail pages (see DetailLinks) also
+# take other firms' resolutions: by detail URL, or by normalised company name plus
+# the detail page's host. A name alone is not enough, as two portfolios' "Atlas" or
+# "Nova" are rarely the same company, but a renamed detail slug on one host is.
+_LEGAL_SUFFIX = re.compile(r"\s+(?:inc|llc|ltd|limited|corp|corporation|co|gmbh|sas|bv|plc)$")
+
+def _name_key(name: str) -> str:
+    return _LEGAL_SUFFIX.sub("", re.sub(r"[^a-z0-9]+", " ", name.lower()).strip())
+
+def _shared_name(company: Dict[str, str]) -> Optional[str]:
+    name = _name_key(company.get('name', ''))
+    return f"{_host(company['href'])}:{name}" if len(name) >= 3 else None
+
+def _website_in_html(html_content: str, original_domain: str) -> Optional[str]:
+    """``_find_website`` over a detail page's static HTML."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_content, "html.parser")
+    for selector in WEBSITE_SELECTORS:
+        for link in soup.select(selector):
+            if _is_website(link.get('href'), original_domain):
+                return link['href']
+    return None
+
+async def _aresolve_detail(href: str, original_domain: str, limit: asyncio.Semaphore,
+                           host_last: Dict[str, float], timeout: float = DETAIL_HTTP_TIMEOUT) -> Optional[str]:
+    """Resolve a detail page without a browser: a redirect off the firm's site, or a website
+    link in the server-rendered HTML. ``None`` means the page needs a browser.
+
+    One GET per page: the body is only read when the redirects end on the firm's own
+    site. ``limit`` caps the host's open requests and ``host_last`` spaces their starts
+    HOST_MIN_INTERVAL apart, as in the browser pool.
+    """
+    import httpx
+    host = _host(href)
+    async with limit:
+        now = time.monotonic()
+        start = host_last[host] = max(now, host_last.get(host, 0.0) + HOST_MIN_INTERVAL)
+        if start > now:
+            await asyncio.sleep(start - now)
+        try:
+            async with _http().stream("GET", href, timeout=timeout) as resp:
+                if resp.status_code >= 400:
+                    _count_http(href, "network")
+                    return None
+                if domain_of(str(resp.url)) != domain_of(href):
+                    _count_http(href, "network")
+                    return str(resp.url) if _is_website(str(resp.url), original_domain) else None
+                if "html" not in resp.headers.get("content-type", "html"):
+                    _count_http(href, "network")
+                    return None
+                await resp.aread()
+                _count_http(href, "network", len(resp.content))
+        except httpx.HTTPError:
+            return None
+    return _website_in_html(resp.text, original_domain)
+
+def _host_limit(host: str) -> int:
+    return HOST_INFLIGHT_OVERRIDES.get(host, HOST_MAX_INFLIGHT)
+
+def _resolve_without_browser(companies: List[Dict[str, str]], indices: List[int], original_domain: str,
+                             links: Dict[str, str], budget: Optional[Budget] = None) -> Dict[int, str]:
+    """Websites for ``companies[i]`` (``i`` in ``indices``) from other firms' runs, then plain HTTP."""
+    found = {}
+    if isinstance(links, DetailLinks):
+        for idx in indices:
+            website = links.shared(companies[idx])
+            if website:
+                found[idx] = website
+    if found:
+        print(f"ℹ️  {len(found)} detail pages already resolved by other firms")
+
+    rest = [idx for idx in indices if idx not in found]
+    if DETAIL_HTTP_RESOLVE and rest:
+        async def resolve_all():
+            limits, host_last = {}, {}
+            for idx in rest:
+                host = _host(companies[idx]['href'])
+                limits.setdefault(host, asyncio.Semaphore(_host_limit(host)))
+            timeout = (budget or Budget()).timeout(DETAIL_HTTP_TIMEOUT, share=0.25)
+            return await asyncio.gather(*(
+                _aresolve_detail(companies[idx]['href'], original_domain, limits[_host(companies[idx]['href'])],
+                                 host_last, timeout)
+                for idx in rest))
+        resolved = {idx: website for idx, website in zip(rest, _run_async(resolve_all())) if website}
+        print(f"ℹ️  {len(resolved)}/{len(rest)} detail pages resolved over plain HTTP")
+        found.update(resolved)
+    return found
+
+def _resolve_detail_pages(context, companies: List[Dict[str, str]], original_domain: str,
+                          pool_size: int = DETAIL_POOL_SIZE,
+                          links: Optional[Dict[str, str]] = None,
+                          on_website: Optional[Callable[[int, str], None]] = None,
+                          budget: Optional[Budget] = None) -> List[Optional[str]]:
+    """Visit company detail pages on a pool of tabs and return their websites in input order.
+
+    Navigations are started on every idle tab before the oldest one is harvested, so
+    the browser loads up to ``pool_size`` pages at once while this thread stays on the
+    sync API. Each detail host gets at most ``HOST_MAX_INFLIGHT`` open requests (see
+    HOST_INFLIGHT_OVERRIDES), spaced ``HOST_MIN_INTERVAL`` seconds apart, so no more
+    tabs are opened than those limits can keep busy.
+
+    ``links`` maps detail hrefs to websites already known; those pages are not visited,
+    and every newly resolved href is added to it. ``on_website(index, website)`` is
+    called for each company as soon as its website is known. No new page is started
+    once ``budget`` runs out; the ones left can be picked up with ``--resume``.
+    """
+    budget = budget or Budget()
+    links = {} if links is None else links
+    on_website = on_website or (lambda idx, website: None)
+    websites: List[Optional[str]] = [links.get(c['href']) for c in companies]
+
+    def resolved(idx: int, website: str) -> None:
+        websites[idx] = website
+        if isinstance(links, DetailLinks):
+            links.add(companies[idx], website)
+        else:
+            links[companies[idx]['href']] = website
+        on_website(idx, website)
+
+    pending = deque(i for i, website in enumerate(websites) if not website)
+    if len(pending) < len(companies):
+        print(f"ℹ️  {len(companies) - len(pending)} detail pages already resolved on a previous run")
+        for idx, website in enumerate(websites):
+            if website:
+                on_website(idx, website)
+
+    for idx, website in sorted(_resolve_without_browser(companies, list(pending), original_domain, links,
+                                                        budget).items()):
+        resolved(idx, website)
+    pending = deque(idx for idx in pending if not websites[idx])
+    _evict_detail_links()
+    if not pending:
+        return websites
+
+    per_host = Counter(_host(companies[idx]['href']) for idx in pending)
+    usable = sum(min(count, _host_limit(host)) for host, count in per_host.items())
+    idle = []
+    for _ in range(max(1, min(pool_size, usable))):
+        tab = context.new_page()
+        tab.set_default_timeout(budget.timeout(30, share=0.5) * 1000)
+        idle.append(tab)
+    tabs = list(idle)
+
+    inflight = deque()                       # (tab, index, host), oldest first
+    host_open, host_last = Counter(), {}
+
+    try:
+        while pending or inflight:
+            if pending and budget.expired():
+                print(f"⚠️  Time budget spent - {len(pending)} detail pages left for --resume")
+                budget.partial = True
+                pending.clear()
+                continue
+            # 1️⃣  start navigations on idle tabs, deferring hosts that are at their limit
+            deferred = []
+            while idle and pending:
+                idx = pending.popleft()
+                company = companies[idx]
+                host = _host(company['href'])
+                if host_open[host] >= _host_limit(host):
+                    deferred.append(idx)
+                    continue
+                gap = HOST_MIN_INTERVAL - (time.monotonic() - host_last.get(host, 0.0))
+                if gap > 0:
+                    time.sleep(gap)
+                host_last[host] = time.monotonic()
+
+                tab = idle.pop()
+                print(f"[{idx+1}/{len(companies)}] Processing {company['name']}")
+                try:
+                    tab.goto(company['href'], wait_until='commit')
+                except Exception as e:
+                    print(f"⚠️  Could not load detail page: {e}")
+                    idle.append(tab)
+                    continue
+                host_open[host] += 1
+                inflight.append((tab, idx, host))
+            pending.extendleft(reversed(deferred))
+
+            if not inflight:
+                continue
+
+            # 2️⃣  harvest the oldest navigation; the others keep loading meanwhile
+            tab, idx, host = inflight.popleft()
+            try:
+                tab.wait_for_load_state('domcontentloaded')
+                try:
+                    tab.wait_for_load_state('networkidle', timeout=10000)
+                except Exception:
+                    pass  # chatty pages never go idle; the DOM is usually enough
+                website = _find_website(tab, original_domain)
+                if website:
+                    print(f"✓ Found website: {website}")
+                    resolved(idx, website)
+                else:
+                    print("⚠️  No website found")
+            except Exception as e:
+                print(f"⚠️  Error processing company: {e}")
+            finally:
+                host_open[host] -= 1
+                idle.append(tab)
+    finally:
+        for tab in tabs:
+            try:
+                tab.close()
+            except Exception:
+                pass
+
+    return websites
 
 # ── Playwright pass ─────────────────────────────────────────────────
-def extract_with_playwright(page_url: str) -> List[Tuple[str, str]]:
-    """Extract company names and their real URLs from portfolio cards using Playwright."""
+_STEALTH_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+    window.chrome = {
+        runtime: {}
+    };
+"""
+
+class BrowserContext(NamedTuple):
+    context: object           # playwright BrowserContext
+    blocked: Counter          # live counts of requests aborted by _block_resources
+
+def _new_context(browser) -> BrowserContext:
+    """A context with the scraper's user agent, stealth script and resource blocking."""
+    context = browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={'width': 1280, 'height': 800}
+    )
+
+    # Add stealth script to avoid detection
+    context.add_init_script(_STEALTH_JS)
+    blocked = _block_resources(context) if BLOCK_RESOURCES else Counter()
+    return BrowserContext(context, blocked)
+
+def _close_quietly(handle) -> None:
+    if handle is None:
+        return
     try:
-        from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-        rows, seen = [], set()
+        handle.close()
+    except Exception:
+        pass
+
+@contextmanager
+def _launched(browser=None):
+    """Yield ``browser`` as-is, or launch a Chromium that is closed on exit."""
+    if browser is not None:
+        yield browser
+        return
+    from playwright.sync_api import sync_playwright
+    ensure_chromium()
+    with sync_playwright() as pw:
+        launched = pw.chromium.launch(headless=HEADLESS)
+        try:
+            yield launched
+        finally:
+            launched.close()
+
+class SharedBrowser:
+    """Chromium processes shared by every target in a batch or by the scrape service.
+
+    Playwright's sync API is bound to the thread that started it, so each browser
+    lives on its own thread and ``call`` queues work onto whichever is free. Every
+    browser keeps one warm context, replaced after ``CONTEXT_MAX_USES`` jobs or a
+    failed job. Chromium is launched once the first job arrives, or right away when
+    ``warm`` is set. A browser that disconnects is relaunched for the next job.
+    """
+
+    def __init__(self, size: int = 1, warm: bool = False):
+        self._jobs = queue.Queue()
+        self._warm = warm
+        self._threads = [threading.Thread(target=self._serve, name=f"vc-scraper-browser-{i}", daemon=True)
+                         for i in range(max(1, size))]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def call(self, fn, *args, **kwargs):
+        """Run ``fn(*args, **kwargs, browser=<Browser>, context=<BrowserContext>)`` on a browser thread."""
+        future = Future()
+        self._jobs.put((contextvars.copy_context().run, (fn, *args), kwargs, future))
+        return future.result()
+
+    def close(self) -> None:
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _serve(self) -> None:
+        job = None if self._warm else self._jobs.get()
+        if job is None and not self._warm:
+            return
+        pw = browser = warm = None
+        uses = 0
+        try:
+            while True:
+                try:
+                    if browser is None or not browser.is_connected():
+                        if browser is not None:
+                            METRICS.inc("retries_total", kind="browser_relaunch")
+                        _close_quietly(browser)
+                        if pw is None:
+                            from playwright.sync_api import sync_playwright
+                            ensure_chromium()
+                            pw = sync_playwright().start()
+                        browser, warm = pw.chromium.launch(headless=HEADLESS), None
+                    if warm is None or uses >= CONTEXT_MAX_USES:
+                        _close_quietly(warm and warm.context)
+                        warm, uses = _new_context(browser), 0
+                except Exception as e:
+                    print(f"⚠️  Shared browser failed: {e}")
+                    if job is not None:
+                        job[-1].set_exception(e)
+                    job = self._jobs.get()
+                    if job is None:
+                        return
+                    continue
+
+                if job is None:
+                    job = self._jobs.get()
+                    if job is None:
+                        return
+                    if not browser.is_connected():
+                        continue
+                fn, args, kwargs, future = job
+                job, uses = None, uses + 1
+                try:
+                    future.set_result(fn(*args, **kwargs, browser=browser, context=warm))
+                except BaseException as e:
+                    future.set_exception(e)
+                    _close_quietly(warm.context)
+                    warm = None
+        finally:
+            _close_quietly(warm and warm.context)
+            _close_quietly(browser)
+            if pw is not None:
+                pw.stop()
+
+def extract_with_playwright(page_url: str, browser=None, links: Optional[Dict[str, str]] = None,
+                            context: Optional[BrowserContext] = None,
+                            hints: Optional[Dict] = None,
+                            on_row: Optional[Callable[[Tuple[str, str]], None]] = None,
+                            budget: Optional[Budget] = None) -> List[Tuple[str, str]]:
+    """Extract company names and their real URLs from portfolio cards using Playwright.
+
+    Pass a live Playwright ``browser`` to reuse it; otherwise one is launched for this call.
+    A warm ``context`` from ``SharedBrowser`` is reused and left open; its cookies are cleared first.
+    ``links`` (detail href -> website) skips detail pages resolved before and collects new ones.
+    ``hints`` (a site profile) supplies the load wait and card selectors to try first, and
+    receives the ones that worked. ``on_row`` sees each row as soon as it is found; if the
+    run breaks off, the rows found so far are still returned and ``budget.partial`` is set.
+    Page load, pagination and detail pages share what is left of ``budget``.
+    """
+    hints = {} if hints is None else hints
+    budget = budget or Budget()
+    on_row = on_row or (lambda row: None)
+    rows, seen = [], set()
+    try:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         
         # Normalize the URL
         if not page_url.startswith('http'):
             page_url = 'https://' + page_url
             
-        original_domain = tldextract.extract(page_url).domain.lower()
+        original_domain = domain_of(page_url)
+        firm = firm_of(page_url)
         print(f"ℹ️  Starting Playwright extraction from {page_url}")
+        clock = _PhaseClock(firm)
         
-        with sync_playwright() as pw:
-            browser = pw.chromium.launch(headless=HEADLESS)
-            context = browser.new_context(
-                user_agent=USER_AGENT,
-                viewport={'width': 1280, 'height': 800}
-            )
+        with _launched(browser) as browser:
+            owned = context is None
+            if owned:
+                context = _new_context(browser)
+            else:
+                context.context.clear_cookies()
+            context, blocked_counts = context
+            blocked_before = Counter(blocked_counts)
             
-            # Add stealth script to avoid detection
-            context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                window.chrome = {
-                    runtime: {}
-                };
-            """)
-            
-            page = context.new_page()
+            page = _Traced(context.new_page(), firm)
             
             # Add headers to avoid blocking
             page.set_extra_http_headers({
@@ -126,284 +1581,187 @@ def extract_with_playwright(page_url: str) -> List[Tuple[str, str]]:
             try:
                 print(f"ℹ️  Loading portfolio page...")
                 
-                # Try multiple times with increasing delays
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        # Try different wait strategies
-                        wait_strategies = ['domcontentloaded', 'networkidle', 'load']
-                        for strategy in wait_strategies:
-                            try:
-                                page.goto(page_url, timeout=60000, wait_until=strategy)
-                                page.wait_for_load_state(strategy, timeout=30000)
-                                break
-                            except Exception as e:
-                                print(f"⚠️  Wait strategy {strategy} failed: {e}")
-                                continue
-                        
-                        # Add random delay between 2-5 seconds
-                        page.wait_for_timeout(3000)
-                        
-                        # Check if page loaded successfully
-                        if page.content():
+                # Each attempt tries the wait strategies in turn (the hinted one first) with
+                # half of the remaining budget per navigation. Timeouts move on to the next
+                # strategy; other navigation errors (DNS, refused, reset) end the attempt.
+                # Attempts after the first wait an exponential, jittered delay.
+                wait_strategies = ['domcontentloaded', 'networkidle', 'load']
+                if hints.get("wait") in wait_strategies:
+                    wait_strategies.remove(hints["wait"])
+                    wait_strategies.insert(0, hints["wait"])
+                loaded = False
+                for attempt in range(1, PAGE_LOAD_ATTEMPTS + 1):
+                    if attempt > 1:
+                        delay = _backoff(attempt - 1)
+                        if budget.remaining() < delay + 1:
                             break
-                            
-                    except Exception as e:
-                        if attempt < max_retries - 1:
-                            delay = (attempt + 1) * 5
-                            print(f"⚠️  Attempt {attempt + 1} failed, waiting {delay}s before retry: {e}")
-                            page.wait_for_timeout(delay * 1000)
-                        else:
-                            raise
-
-                # For sites that require multiple scrolls
+                        print(f"⚠️  Attempt {attempt - 1} failed, waiting {delay:.1f}s before retry")
+                        METRICS.inc("retries_total", firm=firm, kind="page_load")
+                        page.wait_for_timeout(delay * 1000)
+                    for strategy in wait_strategies:
+                        timeout_s = budget.timeout(GOTO_TIMEOUT_S, share=0.5)
+                        if timeout_s < 1:
+                            break
+                        try:
+                            page.goto(page_url, timeout=timeout_s * 1000, wait_until=strategy)
+                            loaded = page.evaluate("!!document.body")
+                        except PlaywrightTimeoutError as e:
+                            print(f"⚠️  Wait strategy {strategy} failed: {e}")
+                            METRICS.inc("retries_total", firm=firm, kind="wait_strategy")
+                            continue
+                        except Exception as e:
+                            print(f"⚠️  Navigation failed: {e}")
+                            break
+                        if loaded:
+                            hints["wait"] = strategy
+                            break
+                    if loaded or budget.expired():
+                        break
+                if not loaded:
+                    if not budget.expired():
+                        budget.page_loaded(False)
+                    raise RuntimeError(f"could not load {page_url}"
+                                       + (" within the time budget" if budget.expired() else ""))
+                budget.page_loaded(True)
+                clock.lap("load")
+
+                # Let client-side rendering finish before scrolling
+                _wait_for_cards(page)
+                clock.lap("render")
+
+                # Infinite scroll and "load more" buttons, then numbered pages below
                 print("ℹ️  Scrolling to load all content...")
-                prev_height = 0
-                scroll_attempts = 0
-                max_scroll_attempts = 5
-                
-                while scroll_attempts < max_scroll_attempts:
-                    # Scroll by viewport height
-                    page.evaluate("window.scrollBy(0, window.innerHeight)")
-                    page.wait_for_timeout(1000)  # Wait for content to load
-                    
-                    # Check if we've reached the bottom
-                    curr_height = page.evaluate("document.body.scrollHeight")
-                    if curr_height == prev_height:
-                        scroll_attempts += 1
-                    else:
-                        scroll_attempts = 0  # Reset counter if height changed
-                    prev_height = curr_height
-                
-                # Wait for any lazy-loaded content
-                page.wait_for_timeout(2000)
+                deadline = time.monotonic() + budget.timeout(PAGINATION_BUDGET_S, share=0.5)
+                _expand_page(page, deadline)
+                clock.lap("scroll")
                 
                 print("ℹ️  Analyzing page structure...")
                 
-                # Try multiple selectors for company elements
-                selectors = [
-                    '[class*="company-card"]',
-                    '[class*="CompanyCard"]',
-                    '[class*="portfolio-item"]',
-                    '[class*="company-logo"]',
-                    '[data-testid*="company"]',
-                    '[data-testid*="portfolio"]',
-                    '[id*="company"]',
-                    '[id*="portfolio"]',
-                    '.company-card',
-                    '[class*="company"]',
-                    '[class*="portfolio-item"]',
-                    '.grid-item',
-                    '.portfolio-card',
-                    'a[href*="/company/"]',
-                    'a[href*="/portfolio/"]',
-                    'a[href*="?company="]',
-                    'div[role="listitem"]'
-                ]
-                
                 # Special handling for Index Ventures and similar sites
                 if 'indexventures.com' in page_url or any(x in page_url.lower() for x in ['portfolio', 'companies']):
                     # Try to find company cards or links
                     company_links = []
-                    for selector in selectors:
+                    cards = _collect_paginated(page, deadline, hints, budget)
+                    clock.lap("cards")
+                    names = clean_names([card['text'] for card in cards])
+                    for card, name in zip(cards, names):
                         try:
-                            elements = page.query_selector_all(selector)
-                            if elements:
-                                print(f"Found {len(elements)} elements with selector: {selector}")
-                                for element in elements:
-                                    try:
-                                        # Get the link URL
-                                        href = None
-                                        if element.get_attribute('href'):
-                                            href = element.get_attribute('href')
-                                        else:
-                                            # Try to find a link inside the element
-                                            link = element.query_selector('a')
-                                            if link:
-                                                href = link.get_attribute('href')
-                                        
-                                        if href:
-                                            # Make relative URLs absolute
-                                            if href.startswith('/'):
-                                                href = urljoin(page_url, href)
-                                            elif href.startswith('//'):
-                                                href = 'https:' + href
-                                                
-                                            # Skip obvious non-company URLs
-                                            if any(x in href.lower() for x in [
-                                                '/blog/', '/news/', '/about/', '/contact/', 
-                                                '/team/', '/careers/', '#', 'javascript:'
-                                            ]):
-                                                continue
-                                                
-                                            # Get the company name
-                                            name = element.inner_text().strip()
-                                            if name:
-                                                name = re.sub(r'\s+', ' ', name)
-                                                name = re.sub(r'^(View|Visit|Go to|Link to|About)\s+', '', name, flags=re.IGNORECASE)
-                                                name = re.sub(r'\s+(Website|Page|Profile)$', '', name, flags=re.IGNORECASE)
-                                                
-                                                if name and len(name) <= 80 and name.lower() not in seen:
-                                                    company_links.append({
-                                                        'name': name,
-                                                        'href': href
-                                                    })
-                                                    seen.add(name.lower())
-                                                    
-                                    except Exception as e:
-                                        print(f"⚠️  Error processing element: {e}")
-                                        continue
-                                        
+                            href = card['href']
+                            if href:
+                                # Make relative URLs absolute
+                                if href.startswith('/'):
+                                    href = urljoin(page_url, href)
+                                elif href.startswith('//'):
+                                    href = 'https:' + href
+
+                                # Skip obvious non-company URLs
+                                if any(x in href.lower() for x in [
+                                    '/blog/', '/news/', '/about/', '/contact/',
+                                    '/team/', '/careers/', '#', 'javascript:'
+                                ]):
+                                    continue
+
+                                if name and len(name) <= 80 and name.lower() not in seen:
+                                    company_links.append({
+                                        'name': name,
+                                        'href': href
+                                    })
+                                    seen.add(name.lower())
+
                         except Exception as e:
-                            print(f"⚠️  Selector {selector} failed: {e}")
+                            print(f"⚠️  Error processing element: {e}")
                             continue
                             
                     if company_links:
                         print(f"\nℹ️  Found {len(company_links)} company links to process")
                         
-                        # Create a new page for visiting company details
-                        detail_page = context.new_page()
-                        detail_page.set_default_timeout(30000)
-                        
-                        for idx, company in enumerate(company_links):
-                            try:
-                                print(f"[{idx+1}/{len(company_links)}] Processing {company['name']}")
-                                
-                                # Navigate to company detail page
-                                try:
-                                    detail_page.goto(company['href'], wait_until='domcontentloaded')
-                                    detail_page.wait_for_load_state('networkidle', timeout=10000)
-                                except Exception as e:
-                                    print(f"⚠️  Could not load detail page: {e}")
-                                    continue
-                                
-                                # Try to find the website link
-                                website = None
-                                website_selectors = [
-                                    'a[href*="://"][target="_blank"]',
-                                    'a[href*="www."]',
-                                    'a[href*="http"]',
-                                    '[class*="website"] a',
-                                    '[class*="link"] a',
-                                    'a[class*="website"]',
-                                    'a[class*="link"]'
-                                ]
-                                
-                                for selector in website_selectors:
-                                    try:
-                                        links = detail_page.query_selector_all(selector)
-                                        for link in links:
-                                            href = link.get_attribute('href')
-                                            if href and not any(x in href.lower() for x in [
-                                                'linkedin.com', 'twitter.com', 'facebook.com',
-                                                'instagram.com', 'youtube.com', 'medium.com',
-                                                'github.com', 'crunchbase.com', original_domain
-                                            ]):
-                                                website = href
-                                                break
-                                        if website:
-                                            break
-                                    except:
-                                        continue
-                                
-                                if website:
-                                    print(f"✓ Found website: {website}")
-                                    rows.append((company['name'], website))
-                                else:
-                                    print("⚠️  No website found")
-                                    
-                                # Add a small delay between requests
-                                detail_page.wait_for_timeout(1000)
-                                
-                            except Exception as e:
-                                print(f"⚠️  Error processing company: {e}")
-                                continue
-                                
-                        detail_page.close()
+                        pool_size = DETAIL_POOL_OVERRIDES.get(_host(page_url), DETAIL_POOL_SIZE)
+                        started = time.monotonic()
+                        found = []
+
+                        def resolved(idx, website):
+                            found.append((idx, (company_links[idx]['name'], website)))
+                            rows.append(found[-1][1])
+                            on_row(found[-1][1])
+
+                        _resolve_detail_pages(_Traced(context, firm), company_links, original_domain, pool_size, links,
+                                              resolved, budget)
+                        elapsed = time.monotonic() - started
+                        clock.lap("details")
+
+                        rows[:] = [row for _, row in sorted(found)]  # back to page order
+                        print(f"ℹ️  Resolved {len(rows)}/{len(company_links)} detail pages in {elapsed:.1f}s "
+                              f"({len(company_links) / max(elapsed, 1e-6):.2f} companies/sec, {pool_size} pages)")
                         
                     else:
                         print("⚠️  No company links found with specialized extraction")
                         
                 else:
                     # Regular extraction for other sites
-                    companies = []
-                    for selector in selectors:
-                        try:
-                            elements = page.query_selector_all(selector)
-                            if elements:
-                                print(f"Found {len(elements)} elements with selector: {selector}")
-                                companies.extend(elements)
-                        except Exception as e:
-                            print(f"⚠️  Selector {selector} failed: {e}")
-                            continue
+                    companies = _collect_paginated(page, deadline, hints, budget)
+                    clock.lap("cards")
                     
                     if companies:
                         print(f"\nℹ️  Found {len(companies)} potential companies")
+                        names = clean_names([company['text'] for company in companies])
                         
-                        for idx, company in enumerate(companies):
+                        for idx, (company, name) in enumerate(zip(companies, names)):
                             try:
-                                # Try to get company info without clicking
-                                try:
-                                    # Get company name from text content
-                                    name = company.inner_text().strip()
-                                    name = re.sub(r'\s+', ' ', name)
-                                    
-                                    # Look for website link
-                                    website = None
-                                    
-                                    # Try to find a website link in the card
-                                    for link in company.query_selector_all('a'):
-                                        href = link.get_attribute('href')
-                                        if href:
-                                            # Skip internal/navigation links
-                                            if any(x in href.lower() for x in [
-                                                '/blog/', '/news/', '/about/', '/contact/', 
-                                                '/team/', '/careers/', '#', 'javascript:',
-                                                '/privacy', '/terms', '/disclosures'
-                                            ]):
-                                                continue
-                                                
-                                            # If it's a relative path, make it absolute
-                                            if href.startswith('/'):
-                                                href = urljoin(page_url, href)
+                                
+                                # Look for website link
+                                website = None
+                                
+                                # Try to find a website link in the card
+                                for href in company['links']:
+                                    if href:
+                                        # Skip internal/navigation links
+                                        if any(x in href.lower() for x in [
+                                            '/blog/', '/news/', '/about/', '/contact/', 
+                                            '/team/', '/careers/', '#', 'javascript:',
+                                            '/privacy', '/terms', '/disclosures'
+                                        ]):
+                                            continue
                                             
-                                            # If it's an external link, it might be the company website
-                                            link_domain = tldextract.extract(href).domain.lower()
-                                            if link_domain and link_domain != original_domain:
-                                                website = href
-                                                break
-                                    
-                                    if website:
-                                        # Clean up the name
-                                        name = re.sub(r'^(View|Visit|Go to|Link to|About)\s+', '', name, flags=re.IGNORECASE)
-                                        name = re.sub(r'\s+(Website|Page|Profile)$', '', name, flags=re.IGNORECASE)
-                                        
-                                        # If name is still not good, try to get it from the website
-                                        if not name or len(name) < 2:
-                                            ext = tldextract.extract(website)
-                                            if ext.domain:
-                                                name = ext.domain.replace('-', ' ').replace('.', ' ').title()
+                                        # If it's a relative path, make it absolute
+                                        if href.startswith('/'):
+                                            href = urljoin(page_url, href)
                                         
-                                        if name and len(name) <= 80 and name.lower() not in seen:
-                                            print(f"[{idx+1}/{len(companies)}] {name}: {website}")
-                                            rows.append((name, website))
-                                            seen.add(name.lower())
-                                    
-                                except Exception as e:
-                                    print(f"⚠️  Could not extract info from company {idx+1}: {e}")
-                                    continue
+                                        # If it's an external link, it might be the company website
+                                        link_domain = domain_of(href)
+                                        if link_domain and link_domain != original_domain:
+                                            website = href
+                                            break
+                                
+                                if website:
+                                    # If name is still not good, try to get it from the website
+                                    if not name or len(name) < 2:
+                                        website_domain = domain_of(website)
+                                        if website_domain:
+                                            name = website_domain.replace('-', ' ').replace('.', ' ').title()
                                     
+                                    if name and len(name) <= 80 and name.lower() not in seen:
+                                        print(f"[{idx+1}/{len(companies)}] {name}: {website}")
+                                        rows.append((name, website))
+                                        on_row(rows[-1])
+                                        seen.add(name.lower())
+                                
                             except Exception as e:
-                                print(f"⚠️  Error processing company element: {e}")
+                                print(f"⚠️  Could not extract info from company {idx+1}: {e}")
                                 continue
                 
             except PlaywrightTimeoutError as e:
                 print(f"⚠️  Playwright timeout: {e}")
+                budget.partial = True
             except Exception as e:
                 print(f"⚠️  Playwright navigation error: {e}")
+                budget.partial = True
             finally:
-                context.close()
-                browser.close()
+                _close_quietly(context if owned else page)
+                blocked = blocked_counts - blocked_before
+                clock.lap("close")
+                print(f"ℹ️  {_host(page_url)} phases: {clock.summary()}")
+                if blocked:
+                    print(f"ℹ️  Blocked requests: {', '.join(f'{n} {kind}' for kind, n in blocked.items())}")
                 
         if rows:
             print(f"ℹ️  Playwright found {len(rows)} companies")
@@ -413,20 +1771,638 @@ def extract_with_playwright(page_url: str) -> List[Tuple[str, str]]:
         
     except Exception as e:
         print(f"⚠️  Playwright extraction failed: {e}")
-        return []
+        budget.partial = True
+        return rows
+
+# ── HTML pass ───────────────────────────────────────────────────────
+# The page is walked once: a SAX-style scan records every <a href> (its text, the
+# text of its first <h4>, whether it wraps a .portfolio-card), the visible text and
+# any pagination controls. lxml does the parsing when installed; otherwise the same
+# scan runs over BeautifulSoup's html.parser tree.
+HTML_PARSER = "auto"      # "lxml", "html.parser" or "auto" (lxml when installed)
+NAV_WORDS = [
+    "home", "about", "team", "contact", "blog", "news", "portfolio",
+    "companies", "investment", "fund", "menu", "navigation"
+]
+DESCRIPTION_WORDS = ["the", "and", "for", "with", "our", "we", "is", "are"]
+LARGE_PORTFOLIO_INDICATORS = [
+    "1000", "1,000", "1400", "1,400", "500+", "1000+", "1,000+",
+    "over 1000", "over 1,000", "thousand", "hundreds of companies",
+    "view all", "show all", "load more", "see all portfolio"
+]
+_HIDDEN_TEXT_TAGS = {"script", "style", "template"}
+# "1,400 companies", "Over 250 portfolio companies", "120+ startups"
+_STATED_SIZE_RE = re.compile(
+    r"\b(\d{1,3}(?:,\d{3})+|\d{2,5})\s*\+?\s*(?:portfolio\s+)?(?:companies|startups|investments|founders)\b",
+    re.IGNORECASE)
+# ?p= is left out: on WordPress it is a post ID (?p=1234), not a page number
+_PAGE_NUMBER_RE = re.compile(r"(?:[?&](?:page|pg)=|/page/)(\d{1,4})\b", re.IGNORECASE)
+
+class _PageScan:
+    """Collects everything ``_analyze_html`` needs during a single document walk."""
+
+    def __init__(self):
+        self.anchors = []     # per <a href>, in document order: [href, text parts, h4 parts, h4 depth, wraps card]
+        self.text = []        # visible text fragments
+        self.pagination = False
+        self._open = []       # anchors whose end tag has not been seen yet
+
+    def start(self, tag: str, href: Optional[str], cls: str) -> None:
+        classes = cls.split()
+        if self._open:
+            wraps_card = "portfolio-card" in classes
+            for frame in self._open:
+                if wraps_card:
+                    frame[4] = True
+                if tag == "h4":
+                    if frame[2] is None:
+                        frame[2], frame[3] = [], 1
+                    elif frame[3]:
+                        frame[3] += 1
+        if ("next" in cls and tag in ("a", "button")) or "pagination" in classes:
+            self.pagination = True
+        if tag == "a" and href is not None:
+            frame = [href, [], None, 0, False]
+            self.anchors.append(frame)
+            self._open.append(frame)
+
+    def end(self, tag: str) -> None:
+        if tag == "a" and self._open:
+            self._open.pop()
+        elif tag == "h4":
+            for frame in self._open:
+                if frame[3]:
+                    frame[3] -= 1
+
+    def data(self, text: str) -> None:
+        self.text.append(text)
+        for frame in self._open:
+            frame[1].append(text)
+            if frame[3]:
+                frame[2].append(text)
+
+def _scan_lxml(html_content: str, scan: _PageScan) -> None:
+    import lxml.html
+    from lxml import etree
+
+    try:
+        try:
+            root = lxml.html.document_fromstring(html_content)
+        except ValueError:  # str input carrying an XML encoding declaration
+            root = lxml.html.document_fromstring(html_content.encode("utf-8"))
+    except etree.ParserError:  # empty document
+        return
+    for event, el in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        tag = el.tag
+        if not isinstance(tag, str):  # comments and processing instructions
+            if el.tail:
+                scan.data(el.tail)
+            continue
+        if event == "start":
+            scan.start(tag, el.get("href"), el.get("class") or "")
+            if el.text and tag not in _HIDDEN_TEXT_TAGS:
+                scan.data(el.text)
+        else:
+            scan.end(tag)
+            if el.tail:
+                scan.data(el.tail)
+
+def _scan_soup(html_content: str, scan: _PageScan) -> None:
+    from bs4 import BeautifulSoup, CData, NavigableString, Tag
+    soup = BeautifulSoup(html_content, "html.parser")
+    stack, tags = [iter(soup.children)], []
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            if tags:
+                scan.end(tags.pop())
+        elif isinstance(node, Tag):
+            cls = node.get("class") or ""
+            scan.start(node.name, node.get("href"), " ".join(cls) if isinstance(cls, list) else cls)
+            tags.append(node.name)
+            stack.append(iter(node.children))
+        elif type(node) in (NavigableString, CData):  # skips comments, <script>, <style>, …
+            scan.data(node)
+
+def _scan_html(html_content: str) -> _PageScan:
+    parser = HTML_PARSER
+    if parser == "auto":
+        try:
+            import lxml.html  # noqa: F401
+            parser = "lxml"
+        except ImportError:
+            parser = "html.parser"
+    scan = _PageScan()
+    (_scan_lxml if parser == "lxml" else _scan_soup)(html_content, scan)
+    return scan
+
+def _analyze_html(url: str, html_content: str) -> Dict:
+    """Parse a fetched portfolio page into candidate rows and the signals used to pick a strategy.
+
+    Returns ``{"rows": [(name, url), ...], "quality": int, "more_content": bool}`` plus the
+    portfolio size the page states (``stated_size``), its highest page number (``page_count``)
+    and embedded data; the result is JSON-serialisable so it can be cached against the page body.
+    """
+    vc_dom = domain_of(url)
+    seen_urls = set()  # Track seen URLs to prevent duplicates
+    html_rows = []
+    anchor_rows = []  # capture exact links from anchor tags when available
+    html_quality_companies = 0
+    more_content = False
+
+    scan = _scan_html(html_content)
+    page_text = "".join(scan.text).lower()
+
+    # 1️⃣  First, capture anchor tags that wrap portfolio cards (very precise for sites like Bling Capital)
+    for href_raw, parts, h4_parts, _, wraps_card in scan.anchors:
+        if wraps_card:
+            href_raw = href_raw.strip()
+            if href_raw == "//":
+                continue  # skip invalid
+            href = urljoin(url, normalize(html.unescape(href_raw)))
+            dom = domain_of(href)
+            if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
+                continue
+            # Portfolio cards usually have an <h4> with the company name
+            if h4_parts is not None:
+                name = "".join(part.strip() for part in h4_parts)
+            else:
+                name = " ".join(part.strip() for part in parts if part.strip())
+            name = _WHITESPACE_RE.sub(" ", name)
+            if name and len(name) <= 80 and href not in seen_urls:
+                anchor_rows.append((name, href))
+                seen_urls.add(href)
+
+    # 2️⃣  Generic pass: Look for any external links that might be company websites (fallback)
+    for href_raw, parts, _, _, _ in scan.anchors:
+        href = urljoin(url, normalize(html.unescape(href_raw)))
+        dom = domain_of(href)
+        if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
+            continue
+        name = _WHITESPACE_RE.sub(" ", " ".join(part.strip() for part in parts if part.strip())) or dom.capitalize()
+        if href in seen_urls or len(name) > 100:
+            continue
+        seen_urls.add(href)
+        html_rows.append((name, href))
+
+    # Prefer anchor_rows if we found a decent amount (exact links)
+    if len(anchor_rows) >= 5:
+        print(f"ℹ️  Anchor-based extraction found {len(anchor_rows)} companies with exact URLs")
+        html_rows = anchor_rows + [row for row in html_rows if row[0] not in {r[0] for r in anchor_rows}]
+    else:
+        print(f"ℹ️  Anchor-based extraction found only {len(anchor_rows)} companies; using generic links too")
+
+    print(f"ℹ️  Basic HTML extraction found {len(html_rows)} potential companies")
+
+    # Analyze quality of HTML extraction results
+    if len(html_rows) > 10:  # If we found a reasonable number
+        # Count how many look like real company names (not navigation/UI)
+        html_quality_companies = sum(company_mask([name for name, _ in html_rows]))
+
+        print(f"ℹ️  Quality company names found: {html_quality_companies}")
+
+        # Special handling for sites that claim to have many more companies
+        # Look for indicators that there's more content (like pagination or "1000+" mentions)
+        has_large_portfolio_indicators = any(indicator in page_text for indicator in LARGE_PORTFOLIO_INDICATORS)
+        more_content = has_large_portfolio_indicators or scan.pagination
+
+    hydrated = _companies_in_json(_hydration_blobs(html_content), vc_dom)
+    if hydrated:
+        print(f"ℹ️  Embedded page data lists {len(hydrated)} companies")
+
+    stated = [int(n.replace(",", "")) for n in _STATED_SIZE_RE.findall(" ".join(scan.text))]
+    pages = [int(n) for href, *_ in scan.anchors for n in _PAGE_NUMBER_RE.findall(href)]
+    return {"rows": html_rows, "quality": html_quality_companies, "more_content": more_content,
+            "stated_size": max(stated, default=None), "page_count": max(pages, default=1),
+            "hydrated": hydrated, "data_urls": _static_data_urls(url, html_content)}
+
+# ── post-processing ─────────────────────────────────────────────────
+# Every scrape's rows go through ``postprocess`` once, whatever strategy produced
+# them: names are cleaned, URLs lose fragments and tracking parameters, and rows
+# are deduplicated on the company's registered domain, so https://x.com/#new_tab
+# and https://www.x.com/ are one company. The regexes are compiled once, and URL
+# canonicalisation and keys are memoised per distinct URL and host, so a merged
+# batch with many repeats costs one parse per distinct value.
+_WHITESPACE_RE = re.compile(r"\s+")
+_NAME_AFFIX_RE = re.compile(r"^(?:View|Visit|Go to|Link to|About)\s+|\s+(?:Website|Page|Profile)$", re.IGNORECASE)
+_NOT_COMPANY_RE = re.compile("|".join(map(re.escape, NAV_WORDS + DESCRIPTION_WORDS)))
+TRACKING_PARAMS = re.compile(
+    r"^(?:utm_\w+|gclid|dclid|fbclid|msclkid|yclid|igshid|mc_cid|mc_eid|_hsenc|_hsmi|hsctatracking|ref|ref_src|_ga)$",
+    re.IGNORECASE)
+SHARED_HOSTS = {  # registered domains hosting many companies: deduplicated on the full URL instead
+    "google.com", "linkedin.com", "github.com", "medium.com", "apple.com", "twitter.com", "x.com",
+    "facebook.com", "instagram.com", "crunchbase.com", "angel.co", "wellfound.com", "notion.site",
+}
+
+def clean_names(names: List[str]) -> List[str]:
+    """Collapse whitespace and drop "View …" / "… Website" link wording, for a batch of names."""
+    return [_NAME_AFFIX_RE.sub("", _WHITESPACE_RE.sub(" ", name).strip()) for name in names]
+
+def company_mask(names: List[str]) -> List[bool]:
+    """For each name, whether it reads like a company name rather than navigation or prose."""
+    return [len(name) <= 50 and len(name.split()) <= 5 and not _NOT_COMPANY_RE.search(name.lower())
+            for name in names]
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: str) -> str:
+    """``url`` without its fragment or tracking parameters, with a lower-case scheme and host."""
+    parsed = urlparse(url.strip())
+    if not parsed.netloc:
+        return url.strip()
+    query = "&".join(pair for pair in parsed.query.split("&")
+                     if pair and not TRACKING_PARAMS.match(pair.split("=", 1)[0]))
+    return parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(),
+                           path=parsed.path or "/", query=query, fragment="").geturl()
+
+@lru_cache(maxsize=65536)
+def _registered_domain(host: str) -> str:
+    """``host``'s registered domain, private suffixes included (``foo.vercel.app``); "" if none."""
+    parts = _tld()(host, include_psl_private_domains=True)
+    return f"{parts.domain}.{parts.suffix}" if parts.domain and parts.suffix else ""
+
+@lru_cache(maxsize=65536)
+def company_key(url: str, own_domain: str = "") -> str:
+    """What makes two rows the same company: the URL's registered domain, or its host,
+    path and query on SHARED_HOSTS, on ``own_domain`` (the portfolio's own site, whose
+    profile pages stand in for missing websites) and on hosts without a registered domain."""
+    canonical = canonical_url(url)
+    host = hostname_of(canonical)
+    host = host[4:] if host.startswith("www.") else host
+    domain = _registered_domain(host)
+    if domain and domain not in SHARED_HOSTS and domain != own_domain:
+        return domain
+    parsed = urlparse(canonical)
+    return host + parsed.path.rstrip("/") + ("?" + parsed.query if parsed.query else "")
+
+def postprocess(rows: List[Tuple[str, str]], page_url: str = "") -> List[Tuple[str, str]]:
+    """Clean, canonicalise and deduplicate ``(name, url)`` rows scraped from ``page_url``,
+    keeping the first row of each company."""
+    own_domain = _registered_domain(hostname_of(page_url)) if page_url else ""
+    names = clean_names([name for name, _ in rows])
+    out, seen = [], set()
+    for name, url in zip(names, [canonical_url(url) for _, url in rows]):
+        key = company_key(url, own_domain)
+        if name and key not in seen:
+            seen.add(key)
+            out.append((name, url))
+    return out
+
+# ── hydration data ──────────────────────────────────────────────────
+# JS-rendered portfolios usually ship their data with the page: Next.js in
+# __NEXT_DATA__, Nuxt 3 in __NUXT_DATA__ (devalue-encoded) or a _payload.json,
+# Nuxt 2 / Redux / Apollo in window.__X__ = {...}, Gatsby in page-data.json, plus
+# JSON-LD. A list of objects that mostly carry a name and an external URL is taken
+# as the portfolio, so such sites resolve without launching a browser.
+HYDRATION_MIN_ROWS = 5
+_NAME_KEYS = ("name", "title", "companyName", "company_name", "company", "displayName")
+_URL_KEYS = ("website", "websiteUrl", "website_url", "companyWebsite", "company_website", "companyUrl",
+             "externalUrl", "external_url", "homepage", "url", "link", "href", "domain", "sameAs")
+_WRAPPER_KEYS = ("attributes", "fields", "node", "item", "data")  # Strapi, Contentful, GraphQL edges, JSON-LD
+_PORTFOLIO_KEY_RE = re.compile(r"portfolio|compan|startup|investment|holding", re.IGNORECASE)
+_SCRIPT_RE = re.compile(r"<script\b([^>]*)>(.*?)</script\s*>", re.IGNORECASE | re.DOTALL)
+_WINDOW_STATE_RE = re.compile(r"window\.(__[A-Z_]+__)\s*=\s*")
+_DEVALUE_WRAPPERS = {"Reactive", "ShallowReactive", "Ref", "ShallowRef", "EmptyRef", "EmptyShallowRef"}
+
+def _revive_devalue(values, index: int = 0):
+    """Rebuild the object graph of a devalue payload (Nuxt 3), where containers hold indexes."""
+    memo = {}
+
+    def revive(i, depth):
+        if not isinstance(i, int) or isinstance(i, bool) or not 0 <= i < len(values) or depth > 400:
+            return None
+        if i in memo:
+            return memo[i]
+        value = values[i]
+        if isinstance(value, dict):
+            out = memo[i] = {}
+            for key, j in value.items():
+                out[key] = revive(j, depth + 1)
+            return out
+        if isinstance(value, list):
+            if value and isinstance(value[0], str):  # typed entry: ["Reactive", 3], ["Set", 4, 5], ...
+                kind, args = value[0], value[1:]
+                if kind in _DEVALUE_WRAPPERS:
+                    out = revive(args[0], depth + 1) if args else None
+                elif kind == "Set":
+                    out = [revive(j, depth + 1) for j in args]
+                elif kind == "Map":
+                    out = {str(revive(k, depth + 1)): revive(v, depth + 1) for k, v in zip(args[::2], args[1::2])}
+                else:  # Date, RegExp, BigInt, ... carry their value as a string
+                    out = args[0] if args else None
+                memo[i] = out
+                return out
+            out = memo[i] = []
+            out.extend(revive(j, depth + 1) for j in value)
+            return out
+        memo[i] = value
+        return value
+
+    return revive(index, 0) if isinstance(values, list) else values
+
+def _hydration_blobs(html_content: str) -> list:
+    """Every JSON document embedded in the page's <script> tags."""
+    blobs = []
+    decoder = json.JSONDecoder()
+    for attrs, body in _SCRIPT_RE.findall(html_content):
+        body = body.strip()
+        if not body:
+            continue
+        attrs = attrs.lower()
+        if "json" in attrs:  # application/json islands (__NEXT_DATA__, __NUXT_DATA__, ...) and ld+json
+            try:
+                data = json.loads(body)
+            except ValueError:
+                continue
+            blobs.append(_revive_devalue(data) if "__nuxt_data__" in attrs else data)
+        else:
+            for match in _WINDOW_STATE_RE.finditer(body):
+                try:
+                    blobs.append(decoder.raw_decode(body, match.end())[0])
+                except ValueError:
+                    continue  # e.g. Nuxt 2's window.__NUXT__=(function(a,b){...}) is not JSON
+    return blobs
+
+def _static_data_urls(url: str, html_content: str) -> List[str]:
+    """Known static data endpoints behind the page: Gatsby page-data and Nuxt payloads."""
+    urls = []
+    if 'id="___gatsby"' in html_content:
+        path = urlparse(url).path.strip("/")
+        urls.append(urljoin(url, f"/page-data/{path or 'index'}/page-data.json"))
+    for href in re.findall(r"""href=["']([^"']*_payload\.json[^"']*)["']""", html_content):
+        urls.append(urljoin(url, html.unescape(href)))
+    return list(dict.fromkeys(urls))
+
+def _json_value(value, keys: Tuple[str, ...]) -> Optional[str]:
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, dict):
+        for key in keys:
+            if isinstance(value.get(key), str) and value[key].strip():
+                return value[key].strip()
+    if isinstance(value, list):
+        for entry in value:
+            found = _json_value(entry, keys)
+            if found:
+                return found
+    return None
+
+def _json_row(item: dict, vc_dom: str) -> Optional[Tuple[str, str]]:
+    """(name, website) from one JSON object, if it has a company-like name and an external URL."""
+    for key in _WRAPPER_KEYS:
+        if isinstance(item.get(key), dict):
+            item = {**item, **item[key]}
+    name = None
+    for key in _NAME_KEYS:
+        if key in item:
+            name = _json_value(item[key], ("rendered", "value", "text"))
+            if name:
+                break
+    if not name or len(name) > 80:
+        return None
+    for key in _URL_KEYS:
+        if key not in item:
+            continue
+        candidates = item[key] if isinstance(item[key], list) else [item[key]]
+        for candidate in candidates:
+            website = _json_value(candidate, ("url", "href", "value"))
+            if not website or " " in website:
+                continue
+            if not re.match(r"https?://", website, re.IGNORECASE):
+                if website.startswith(("/", "#", "mailto:", "tel:")) or "." not in website:
+                    continue
+                website = "https://" + website.lstrip("/")
+            dom = domain_of(website)
+            if dom and dom != vc_dom and dom not in BLOCKLIST_DOMAINS:
+                return html.unescape(name), website
+    return None
+
+def _companies_in_json(blobs: list, vc_dom: str) -> List[Tuple[str, str]]:
+    """Rows from the one list in ``blobs`` that best looks like the portfolio.
+
+    Candidates are lists whose objects mostly look like companies. Pages often carry
+    several (featured, latest news, the full portfolio); the largest one under a
+    portfolio-like key wins, else the largest overall.
+    """
+    best, best_named = [], []
+    stack = [(blob, "") for blob in blobs]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((value, f"{path}.{key}") for key, value in node.items())
+        elif isinstance(node, list):
+            items = [entry for entry in node if isinstance(entry, dict)]
+            if len(items) >= HYDRATION_MIN_ROWS:
+                rows = [row for row in (_json_row(entry, vc_dom) for entry in items) if row]
+                if len(rows) >= HYDRATION_MIN_ROWS and len(rows) * 2 >= len(items):
+                    rows = _merge_rows([rows])
+                    if len(rows) >= len(best):
+                        best = rows
+                    if _PORTFOLIO_KEY_RE.search(path) and len(rows) >= len(best_named):
+                        best_named = rows
+                    continue
+            stack.extend((entry, path) for entry in node)
+    return best_named or best
+
+def _rows_from_data_urls(data_urls: List[str], url: str) -> List[Tuple[str, str]]:
+    """Fetch static data endpoints (see ``_static_data_urls``) and pull company rows out of them."""
+    async def fetch_all():
+        return await asyncio.gather(*(_aget(data_url) for data_url in data_urls), return_exceptions=True)
+
+    blobs = []
+    for data_url, page in zip(data_urls, _run_async(fetch_all())):
+        if isinstance(page, Exception) or page.status != 200:
+            continue
+        try:
+            data = json.loads(page.text)
+        except ValueError:
+            continue
+        blobs.append(_revive_devalue(data) if data_url.split("?")[0].endswith("_payload.json") else data)
+        print(f"ℹ️  Read static page data from {data_url}")
+    return _companies_in_json(blobs, domain_of(url))
 
 # ── master extractor ────────────────────────────────────────────────
-def extract_companies(url: str) -> List[Tuple[str, str]]:
-    """Extract companies from a VC portfolio page."""
+def _run_playwright(url: str, browser: Optional[SharedBrowser] = None,
+                    links: Optional[Dict[str, str]] = None, hints: Optional[Dict] = None,
+                    on_row: Optional[Callable] = None, budget: Optional[Budget] = None) -> List[Tuple[str, str]]:
+    if budget is not None and budget.remaining() < 5:
+        print("⚠️  Time budget spent - skipping Playwright")
+        budget.partial = True
+        return []
+    if breaker_open_until(_host(url)):
+        print(f"⚠️  {_host(url)} keeps failing - skipping Playwright")
+        return []
+    with METRICS.span("playwright", firm_of(url)):
+        if browser is None:
+            return extract_with_playwright(url, links=links, hints=hints, on_row=on_row, budget=budget)
+        try:
+            return browser.call(extract_with_playwright, url, links=links, hints=hints, on_row=on_row,
+                                budget=budget)
+        except Exception as e:
+            print(f"⚠️  Playwright extraction failed: {e}")
+            return []
+
+def _page_analysis(url: str, page: Fetched) -> Dict:
+    """``_analyze_html`` for ``page``, reused from the last run when the body is unchanged."""
+    with METRICS.span("html", firm_of(url)):
+        analysis = _cached_extraction(page.body_hash, url) if page.from_cache else None
+        if analysis:
+            print("ℹ️  Page unchanged since last run - reusing cached HTML extraction")
+        else:
+            analysis = _analyze_html(url, page.text)
+            _store_extraction(page.body_hash, url, analysis)
+        return analysis
+
+def _hydrated_rows(url: str, analysis: Dict) -> List[Tuple[str, str]]:
+    """Companies from the page's embedded hydration data, or from its static data files."""
+    hydrated = [tuple(row) for row in analysis["hydrated"]]
+    if len(hydrated) < HYDRATION_MIN_ROWS and analysis["data_urls"]:
+        with METRICS.span("data_files", firm_of(url)):
+            hydrated = _rows_from_data_urls(analysis["data_urls"], url)
+    return hydrated
+
+def _expected_size(analysis: Dict, found: int) -> Optional[int]:
+    """Portfolio size the page suggests: its stated count, else ``found`` times its page count."""
+    if analysis.get("stated_size"):
+        return analysis["stated_size"]
+    if analysis.get("page_count", 1) > 1:
+        return found * analysis["page_count"]
+    return None
+
+def _merge_found(primary: List[Tuple[str, str]], extra: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """``primary`` followed by the rows of ``extra`` whose URL it doesn't already have."""
+    keys = {company_key(website) for _, website in primary}
+    return primary + [row for row in extra if company_key(row[1]) not in keys]
+
+def extract_companies(url: str, browser: Optional[SharedBrowser] = None,
+                      links: Optional[Dict[str, str]] = None) -> List[Tuple[str, str]]:
+    """Extract companies from a VC portfolio page.
+
+    Pass a ``SharedBrowser`` to run any Playwright stage on it instead of launching Chromium,
+    and a ``links`` dict to reuse and collect detail-page resolutions (see ``known_links``).
+    The site's profile, when there is one, is tried before full discovery.
+    """
+    return _extract(url, browser, links)[0]
+
+def iter_companies(url: str, browser: Optional[SharedBrowser] = None,
+                   links: Optional[Dict[str, str]] = None) -> Iterator[Dict]:
+    """``extract_companies`` as a stream of output records (see ``_record``).
+
+    Rows from a Playwright crawl are yielded as each one is found rather than when the
+    crawl ends, so a long detail-page run produces output even if it is cut short.
+    """
+    if not url.startswith('http'):
+        url = 'https://' + url
+    firm = firm_of(url)
+    events = queue.Queue()
+
+    def run():
+        try:
+            events.put(("done", _extract(url, browser, links, lambda row: events.put(("row", row)))))
+        except BaseException as e:
+            events.put(("error", e))
+
+    threading.Thread(target=run, name="vc-scraper-extract", daemon=True).start()
+    own_domain = _registered_domain(hostname_of(url))
+    streamed = set()  # company keys already yielded
+    while True:
+        kind, value = events.get()
+        if kind == "error":
+            raise value
+        if kind == "row":
+            for row in postprocess([value], url):
+                if company_key(row[1], own_domain) not in streamed:
+                    streamed.add(company_key(row[1], own_domain))
+                    yield _record(firm, row, "playwright")
+            continue
+        rows, method = value
+        for row in rows:
+            if company_key(row[1], own_domain) not in streamed:
+                yield _record(firm, row, method)
+        return
+
+def _record(firm: str, row: tuple, method: Optional[str], change: Optional[str] = None) -> Dict:
+    """One output record: firm, company, url, extraction method and UTC timestamp."""
+    # rows without a strategy are HTML results kept because Playwright came back empty
+    record = {"firm": firm, "company": row[0], "url": row[1], "method": method or "html",
+              "scraped_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+    if change:
+        record["change"] = change
+    return record
+
+def _extract(url: str, browser: Optional[SharedBrowser] = None, links: Optional[Dict[str, str]] = None,
+             on_row: Optional[Callable] = None,
+             budget: Optional[Budget] = None) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """``extract_companies`` plus the method behind the rows.
+
+    ``on_row`` is only fed by a Playwright run whose rows are final as found, so the
+    streamed rows are always part of the result. Each call is one scrape for the
+    metrics log and, with PROFILER set, one profile. Pass ``budget`` to see afterwards
+    whether the rows are ``partial``.
+    """
     # Normalize the URL
     if not url.startswith('http'):
         url = 'https://' + url
-    
-    vc_dom = tldextract.extract(url).domain.lower()
-    rows, seen = [], set()
-    seen_urls = set()  # Track seen URLs to prevent duplicates
+    firm = firm_of(url)
+    closes_at = breaker_open_until(_host(url))
+    if closes_at:
+        print(f"⏭️  {firm}: skipped - its page loads keep failing "
+              f"(retried after {datetime.fromtimestamp(closes_at).strftime('%H:%M')})")
+        METRICS.inc("breaker_skips_total", firm=firm)
+        return [], None
+    before, started = METRICS.snapshot(firm), time.monotonic()
+    budget = budget or Budget(FIRM_BUDGET_S)
+    scraping = _scrape_firm.set(firm)
+    try:
+        with _profiled(firm):
+            rows, strategy = _extract_rows(url, firm, browser, links, on_row, budget)
+            with METRICS.span("postprocess", firm):
+                rows = postprocess(rows, url)
+    finally:
+        if budget.loaded:
+            _host_ok(_host(url))
+        elif budget.loaded is False:  # one failure per scrape, however many loads gave up
+            _host_failed(_host(url))
+        _scrape_firm.reset(scraping)
+    if budget.expired():  # some stage was cut off by the budget, even if it didn't say so
+        budget.partial = True
+    _report_run(firm, url, strategy, len(rows), time.monotonic() - started, before)
+    return rows, strategy
+
+def _extract_rows(url: str, firm: str, browser: Optional[SharedBrowser], links: Optional[Dict[str, str]],
+                  on_row: Optional[Callable], budget: Budget) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """Replay the site profile, else discover, within ``budget``; the body of ``_extract``."""
+    if links is None:  # resolved detail pages are checkpointed either way
+        links = known_links(firm, RESUME_MAX_AGE) if RESUME else DetailLinks(firm)
+
+    profile = site_profile(firm, url) if SITE_PROFILES else None
+    if profile:
+        held: List[Tuple[str, str]] = []  # streamed only once the replay is accepted
+        rows = _replay_profile(url, profile, browser, links, budget, held.append)
+        if rows and len(rows) >= PROFILE_DROP_RATIO * profile["rows"]:
+            save_site_profile(firm, url, profile["strategy"], profile, len(rows))
+            for row in held if on_row else ():
+                on_row(row)
+            return rows, profile["strategy"]
+        print(f"⚠️  {firm}: {profile['strategy']} profile returned {len(rows)} companies "
+              f"(last run {profile['rows']}) - rediscovering")
+        budget.partial = False  # judged on what discovery finds
+
+    hints: Dict = {}
+    rows, strategy = _discover(url, browser, links, hints, on_row, budget)
+    if rows and strategy:
+        save_site_profile(firm, url, strategy, hints, len(rows))
+    return rows, strategy
+
+def _discover(url: str, browser: Optional[SharedBrowser], links: Optional[Dict[str, str]],
+              hints: Dict, on_row: Optional[Callable] = None,
+              budget: Optional[Budget] = None) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """Try every strategy; returns the rows and the strategy that produced them.
 
-    # Try WordPress JSON API first (common for many VC sites)
+    The strategy is ``None`` when the rows are only a fallback and not worth a profile.
+    ``hints`` collects the API endpoint, card selectors and load wait that were used.
+    """
+    # Probe WordPress/JSON APIs (common for many VC sites) while the page downloads
     wp_api_endpoints = [
         url.rstrip("/").split("/portfolio")[0] + "/wp-json/wp/v2/portfolio",
         url.rstrip("/") + "/wp-json/wp/v2/portfolio",
@@ -434,183 +2410,617 @@ def extract_companies(url: str) -> List[Tuple[str, str]]:
         url.rstrip("/") + "/api/companies"
     ]
     
-    for wp_api in wp_api_endpoints:
-        try:
-            if requests.head(wp_api, timeout=10).status_code == 200:
-                print("ℹ️  Using WordPress/API endpoint")
-                api_data = requests.get(wp_api, timeout=TIMEOUT).json()
-                for item in api_data:
-                    if isinstance(item, dict):
-                        name = ""
-                        website = ""
-                        
-                        # Try different field names for company name
-                        for name_field in ["title", "name", "company_name", "company"]:
-                            if name_field in item:
-                                if isinstance(item[name_field], dict) and "rendered" in item[name_field]:
-                                    name = item[name_field]["rendered"].strip()
-                                elif isinstance(item[name_field], str):
-                                    name = item[name_field].strip()
-                                break
-                        
-                        # Try different field names for website
-                        for url_field in ["website", "company_website", "url", "link", "acf"]:
-                            if url_field in item:
-                                if url_field == "acf" and isinstance(item[url_field], dict):
-                                    website = item[url_field].get("company_website", "")
-                                elif isinstance(item[url_field], str):
-                                    website = item[url_field]
-                                break
-                        
-                        if name and len(name) > 1:
-                            final_url = website or f"https://www.google.com/search?q={name.replace(' ', '+')}+company"
-                            if final_url not in seen_urls:
-                                rows.append((name, final_url))
-                                seen_urls.add(final_url)
-                
-                if rows:
-                    return rows
-        except Exception as e:
-            continue
+    print(f"ℹ️  Fetching {url}")
+    with METRICS.span("fetch", firm_of(url)):
+        api_rows, page, fetch_error = _run_async(
+            _aprobe_and_fetch(url, list(dict.fromkeys(wp_api_endpoints)), hints, budget))
+    if api_rows:
+        return api_rows, "api"
 
     # Try basic HTML scraping first and store results as fallback
     html_rows = []
-    anchor_rows = []  # capture exact links from anchor tags when available
-    html_quality_companies = 0
     
     try:
-        # Fetch the page content
-        print(f"ℹ️  Fetching {url}")
-        html_content = fetch(url)
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # 1️⃣  First, capture anchor tags that wrap portfolio cards (very precise for sites like Bling Capital)
-        for a in soup.find_all("a", href=True):
-            if a.find(class_="portfolio-card"):
-                href_raw = a["href"].strip()
-                if href_raw == "//":
-                    continue  # skip invalid
-                href = urljoin(url, normalize(html.unescape(href_raw)))
-                dom = tldextract.extract(href).domain.lower()
-                if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
-                    continue
-                # Portfolio cards usually have an <h4> with the company name
-                h4 = a.find("h4")
-                name = h4.get_text(strip=True) if h4 else a.get_text(" ", strip=True)
-                name = re.sub(r"\s+", " ", name)
-                if name and len(name) <= 80 and href not in seen_urls:
-                    anchor_rows.append((name, href))
-                    seen_urls.add(href)
-                    seen.add(name.lower())
-
-        # 2️⃣  Generic pass: Look for any external links that might be company websites (fallback)
-        for a in soup.find_all("a", href=True):
-            href = urljoin(url, normalize(html.unescape(a["href"])))
-            dom = tldextract.extract(href).domain.lower()
-            if not dom or dom == vc_dom or dom in BLOCKLIST_DOMAINS:
-                continue
-            name = re.sub(r"\s+", " ", a.get_text(" ", strip=True)) or dom.capitalize()
-            if href in seen_urls or len(name) > 100:
-                continue
-            seen_urls.add(href)
-            html_rows.append((name, href))
+        if fetch_error:
+            raise fetch_error
+        analysis = _page_analysis(url, page)
+        html_rows = [tuple(row) for row in analysis["rows"]]
+        html_quality_companies = analysis["quality"]
 
-        # Prefer anchor_rows if we found a decent amount (exact links)
-        if len(anchor_rows) >= 5:
-            print(f"ℹ️  Anchor-based extraction found {len(anchor_rows)} companies with exact URLs")
-            html_rows = anchor_rows + [row for row in html_rows if row[0] not in {r[0] for r in anchor_rows}]
-        else:
-            print(f"ℹ️  Anchor-based extraction found only {len(anchor_rows)} companies; using generic links too")
-        
-        print(f"ℹ️  Basic HTML extraction found {len(html_rows)} potential companies")
-        
-        # Analyze quality of HTML extraction results
-        if len(html_rows) > 10:  # If we found a reasonable number
-            # Count how many look like real company names (not navigation/UI)
-            for name, company_url in html_rows:
-                name_lower = name.lower()
-                # Skip obvious navigation/UI elements
-                if any(nav_word in name_lower for nav_word in [
-                    "home", "about", "team", "contact", "blog", "news", "portfolio", 
-                    "companies", "investment", "fund", "menu", "navigation"
-                ]):
-                    continue
-                # Skip very long descriptions
-                if len(name) > 50 or len(name.split()) > 5:
-                    continue
-                # Skip if it looks like a sentence or description
-                if any(word in name_lower for word in ["the", "and", "for", "with", "our", "we", "is", "are"]):
-                    continue
-                
-                html_quality_companies += 1
-            
-            print(f"ℹ️  Quality company names found: {html_quality_companies}")
-            
-            # Special handling for sites that claim to have many more companies
-            # Look for indicators that there's more content (like pagination or "1000+" mentions)
-            soup_text = soup.get_text().lower()
-            has_large_portfolio_indicators = any(indicator in soup_text for indicator in [
-                "1000", "1,000", "1400", "1,400", "500+", "1000+", "1,000+", 
-                "over 1000", "over 1,000", "thousand", "hundreds of companies",
-                "view all", "show all", "load more", "see all portfolio"
-            ])
-            
-            has_pagination = soup.select_one("a[class*='next'], button[class*='next'], .pagination")
-            
+        # JS-heavy sites: embedded hydration data beats both thin HTML and a browser session
+        hydrated = _hydrated_rows(url, analysis)
+        if len(hydrated) >= HYDRATION_MIN_ROWS and len(hydrated) >= html_quality_companies:
+            print(f"ℹ️  Using embedded page data ({len(hydrated)} companies)")
+            return hydrated, "hydration"
+
+        if len(html_rows) > 10:
             # If we found quality companies BUT there are indicators of much more content,
-            # use Playwright to get the full dataset, but compare results
-            if html_quality_companies >= 15 and (has_large_portfolio_indicators or has_pagination):
-                print("ℹ️  Detected potential for more content - testing Playwright extraction")
-                playwright_results = extract_with_playwright(url)  # Pass the original portfolio URL
-                
-                # Compare results and use the better one
-                if playwright_results and len(playwright_results) > len(html_rows) * 1.2:  # Playwright found 20% more
-                    print(f"ℹ️  Playwright found more companies ({len(playwright_results)} vs {len(html_rows)}) - using Playwright results")
-                    return playwright_results
-                elif playwright_results and len(playwright_results) > 50:  # Playwright found a significant number
-                    print(f"ℹ️  Playwright found substantial companies ({len(playwright_results)}) - using Playwright results")
-                    return playwright_results
-                else:
-                    print(f"ℹ️  Playwright didn't improve results - using HTML extraction ({len(html_rows)} companies)")
-                    return html_rows
+            # use Playwright only when the page suggests it will find meaningfully more
+            if html_quality_companies >= 15 and analysis["more_content"]:
+                expected = _expected_size(analysis, html_quality_companies)
+                if expected is not None and expected <= html_quality_companies * PLAYWRIGHT_MIN_GAIN:
+                    print(f"ℹ️  HTML already has {html_quality_companies} of ~{expected} companies - skipping Playwright")
+                    return html_rows, "html"
+                print(f"ℹ️  Detected potential for more content (~{expected or '?'} companies) - running Playwright")
+                playwright_results = _run_playwright(url, browser, links, hints, budget=budget)  # Pass the original portfolio URL
+                if not playwright_results:
+                    print(f"ℹ️  Playwright found nothing - using HTML extraction ({len(html_rows)} companies)")
+                    return html_rows, None
+
+                # Keep both: browser rows first, then HTML companies the browser missed
+                mask = company_mask([name for name, _ in html_rows])
+                html_companies = [row for row, ok in zip(html_rows, mask) if ok]
+                if len(_merge_found(html_companies, playwright_results)) == len(html_companies):
+                    print(f"ℹ️  Playwright didn't add companies - using HTML extraction ({len(html_rows)} companies)")
+                    return html_rows, "html"
+                merged = _merge_found(playwright_results, html_companies)
+                extra = len(merged) - len(playwright_results)
+                print(f"ℹ️  Merged {len(playwright_results)} Playwright + {extra} HTML-only companies")
+                return merged, "merged" if extra else "playwright"
             
             # If we found a good number of quality company names, use HTML results
             elif html_quality_companies >= 15:  
                 print("ℹ️  Using HTML extraction results (good quality detected)")
-                return html_rows
+                return html_rows, "html"
             
     except Exception as e:
         print(f"ℹ️  Basic HTML extraction failed: {e}")
 
     # Fall back to Playwright extraction, but use HTML results if Playwright fails
     print("ℹ️  Using Playwright extraction")
-    playwright_results = extract_with_playwright(url)  # Pass the original portfolio URL
+    playwright_results = _run_playwright(url, browser, links, hints, on_row, budget)  # Pass the original portfolio URL
     
     # If Playwright failed but we have HTML results, use those as fallback
     if not playwright_results and html_rows:
         print(f"ℹ️  Playwright extraction failed, falling back to HTML results ({len(html_rows)} companies)")
-        return html_rows
+        return html_rows, None
     elif playwright_results:
-        return playwright_results
+        return playwright_results, "playwright"
     else:
         # Both failed, return empty list
         print("⚠️  Both Playwright and HTML extraction failed")
+        return [], None
+
+# ── site profiles ───────────────────────────────────────────────────
+# What worked for a portfolio page last time: the strategy that produced its rows ("api",
+# "hydration", "html", "playwright" or "merged", browser rows topped up from the
+# HTML), plus the API endpoint, card selectors and page-load wait behind it.
+# Replaying a profile skips the API probes, the selector sweep and the
+# HTML-vs-Playwright comparison.
+def site_profile(firm: str, url: str) -> Optional[Dict]:
+    """The profile saved for ``firm``'s portfolio page ``url``."""
+    found = _db("SELECT strategy, endpoint, selectors, wait, rows FROM page_profiles WHERE firm = ? AND page = ?",
+                (firm, url))
+    if not found:
+        return None
+    strategy, endpoint, selectors, wait, rows = found[0]
+    return {"strategy": strategy, "endpoint": endpoint, "selectors": json.loads(selectors or "[]"),
+            "wait": wait, "rows": rows}
+
+def save_site_profile(firm: str, url: str, strategy: str, hints: Dict, rows: int) -> None:
+    _db("INSERT OR REPLACE INTO page_profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (firm, url, strategy, hints.get("endpoint"), json.dumps(hints.get("selectors") or []),
+         hints.get("wait"), rows, time.time()))
+
+def _replay_profile(url: str, profile: Dict, browser: Optional[SharedBrowser],
+                    links: Optional[Dict[str, str]], budget: Optional[Budget] = None,
+                    on_row: Optional[Callable] = None) -> List[Tuple[str, str]]:
+    """Rows from the profile's strategy alone; ``[]`` when it no longer works.
+
+    A replayed Playwright crawl streams its rows to ``on_row`` like a discovered one; the
+    caller holds them until the replay passes its row check.
+    """
+    strategy = profile["strategy"]
+    print(f"ℹ️  Replaying site profile: {strategy}")
+    try:
+        if strategy == "api":
+            with METRICS.span("fetch", firm_of(url)):
+                return _run_async(_aprobe_api(profile["endpoint"], budget))
+        if strategy == "playwright":
+            return _run_playwright(url, browser, links, profile, on_row, budget)
+        with METRICS.span("fetch", firm_of(url)):
+            page = _run_async(_afetch(url, budget))
+        analysis = _page_analysis(url, page)
+        html_rows = [tuple(row) for row in analysis["rows"]]
+        if strategy == "hydration":
+            return _hydrated_rows(url, analysis)
+        if strategy == "merged":
+            mask = company_mask([name for name, _ in html_rows])
+            return _merge_found(_run_playwright(url, browser, links, profile, budget=budget),
+                                [row for row, ok in zip(html_rows, mask) if ok])
+        return html_rows
+    except Exception as e:
+        print(f"⚠️  Site profile failed: {e}")
         return []
 
+# ── batch mode ──────────────────────────────────────────────────────
+def firm_of(url: str) -> str:
+    """Tag used for a portfolio's rows in merged output, e.g. ``av.vc``."""
+    host = _host(url if url.startswith("http") else "https://" + url)
+    return host[4:] if host.startswith("www.") else host
+
+def read_targets(source: str) -> List[str]:
+    """Portfolio URLs from a file (or ``-`` for stdin), one per line; ``#`` starts a comment."""
+    lines = sys.stdin.read().splitlines() if source == "-" else Path(source).read_text(encoding="utf-8").splitlines()
+    targets = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            targets.append(line if line.startswith("http") else "https://" + line)
+    return targets
+
+def scrape_batch(urls: List[str], workers: int = BATCH_WORKERS, incremental: bool = False,
+                 browsers: int = 1, processes: int = 1) -> List[tuple]:
+    """Scrape many portfolio pages with shared browsers and one HTTP pool (per process).
+
+    Returns ``(firm, company, url)`` rows grouped by target in input order, or
+    ``(firm, change, company, url)`` rows from ``scrape_changes`` when ``incremental``.
+    """
+    order = {firm: i for i, firm in reversed(list(enumerate(map(firm_of, urls))))}
+    records = sorted(iter_batch(urls, workers, incremental, browsers, processes), key=lambda r: order[r["firm"]])
+    fields = ("firm", "change", "company", "url") if incremental else ("firm", "company", "url")
+    return [tuple(record[field] for field in fields) for record in records]
+
+def iter_batch(urls: List[str], workers: int = BATCH_WORKERS, incremental: bool = False,
+               browsers: int = 1, processes: int = 1) -> Iterator[Dict]:
+    """Output records (see ``_record``) for many targets, yielded as the workers produce them.
+
+    With ``processes`` > 1 the targets are sharded by domain over that many worker
+    processes, each running its own batch (``workers`` threads, ``browsers`` Chromiums).
+    """
+    if processes > 1:
+        yield from _iter_sharded(urls, processes, workers, incremental, browsers)
+        return
+    job = iter_changes if incremental else iter_companies
+    out = queue.Queue()
+
+    def run(url):
+        count = 0
+        try:
+            for record in job(url, browser):
+                out.put(record)
+                count += 1
+        except Exception as e:
+            print(f"⚠️  {url} failed: {e}")
+        print(f"ℹ️  {firm_of(url)}: {count} {'changes' if incremental else 'companies'}")
+        out.put(None)  # this target is done
+
+    with SharedBrowser(browsers) as browser, ThreadPoolExecutor(max_workers=workers) as pool:
+        for url in urls:
+            pool.submit(run, url)
+        remaining = len(urls)
+        while remaining:
+            record = out.get()
+            if record is None:
+                remaining -= 1
+            else:
+                yield record
+
+# ── sharded batches ─────────────────────────────────────────────────
+# One process drives its browsers through the sync Playwright API and parses on one
+# GIL, so very large batches are split over worker processes. Every registered
+# domain lands in exactly one shard, which keeps the per-host politeness limits
+# (enforced inside a process) intact. Workers share the SQLite state store, so a
+# detail page resolved by one is reused by the others. The coordinator streams
+# their records and reports each worker's throughput.
+_WORKER_SETTINGS = ("STATE_DIR", "HTTP_CACHE", "SITE_PROFILES", "RESUME", "FIRM_BUDGET_S", "BREAKER",
+                    "METRICS_LOG", "METRICS_FILE", "PROFILER", "PROFILE_DIR")
+
+def shard_targets(urls: List[str], shards: int) -> List[List[str]]:
+    """Split ``urls`` into at most ``shards`` lists without splitting a registered domain.
+
+    Domains are placed largest first, each on the shard with the fewest targets so far.
+    """
+    groups: Dict[str, List[str]] = {}
+    for url in urls:
+        host = _host(url)
+        groups.setdefault(_registered_domain(host) or host, []).append(url)
+    placed: List[List[str]] = [[] for _ in range(max(1, shards))]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(placed, key=len).extend(group)
+    return [shard for shard in placed if shard]
+
+def _shard_worker(index: int, urls: List[str], workers: int, incremental: bool, browsers: int,
+                  settings: Dict, out) -> None:
+    """Entry point of a worker process: run one shard and send its records to ``out``."""
+    globals().update(settings)
+    started, count = time.monotonic(), 0
+    try:
+        for record in iter_batch(urls, workers, incremental, browsers):
+            out.put(("record", index, record))
+            count += 1
+    finally:
+        out.put(("done", index, {"targets": len(urls), "records": count,
+                                 "seconds": time.monotonic() - started}))
+
+def _iter_sharded(urls: List[str], processes: int, workers: int, incremental: bool,
+                  browsers: int) -> Iterator[Dict]:
+    import multiprocessing
+    spawn = multiprocessing.get_context("spawn")  # fork would copy the HTTP loop thread and DB handle
+    shards = shard_targets(urls, processes)
+    out = spawn.Queue()
+    settings = {name: globals()[name] for name in _WORKER_SETTINGS}
+    procs = []
+    for index, shard in enumerate(shards):
+        own = dict(settings)
+        if METRICS_FILE:  # one Prometheus file per worker: vc.prom -> vc.w0.prom
+            path = Path(METRICS_FILE)
+            own["METRICS_FILE"] = str(path.with_name(f"{path.stem}.w{index}{path.suffix}"))
+        proc = spawn.Process(target=_shard_worker, name=f"vc-scraper-shard-{index}", daemon=True,
+                             args=(index, shard, workers, incremental, browsers, own, out))
+        proc.start()
+        procs.append(proc)
+    print(f"ℹ️  {len(urls)} targets sharded by domain over {len(shards)} processes "
+          f"({', '.join(str(len(shard)) for shard in shards)})")
+
+    stats: Dict[int, Dict] = {}
+    records = Counter()
+    try:
+        while len(stats) < len(procs):
+            try:
+                kind, index, value = out.get(timeout=5)
+            except queue.Empty:
+                # a worker that exits cleanly has already queued its "done"; others crashed
+                for index, proc in enumerate(procs):
+                    if index not in stats and proc.exitcode not in (None, 0):
+                        print(f"⚠️  Worker {index} died with exit code {proc.exitcode}")
+                        stats[index] = {"targets": len(shards[index]), "records": records[index],
+                                        "seconds": None}
+                continue
+            if kind == "record":
+                records[index] += 1
+                yield value
+            else:
+                stats[index] = value
+    finally:
+        for proc in procs:
+            if proc.is_alive() and len(stats) < len(procs):
+                proc.terminate()
+            proc.join()
+
+    noun = "changes" if incremental else "companies"
+    for index in sorted(stats):
+        done = stats[index]
+        if done["seconds"] is None:
+            print(f"ℹ️  Worker {index}: {done['targets']} targets, {done['records']} {noun} before it died")
+            continue
+        seconds = max(done["seconds"], 1e-6)
+        print(f"ℹ️  Worker {index}: {done['targets']} targets, {done['records']} {noun} in {seconds:.1f}s "
+              f"({done['records'] / seconds:.2f} {noun}/sec, {done['targets'] / seconds * 60:.1f} targets/min)")
+
+# ── incremental mode ────────────────────────────────────────────────
+def scrape_changes(url: str, browser: Optional[SharedBrowser] = None) -> List[Tuple[str, str, str]]:
+    """Scrape ``url`` and return ``(change, company, url)`` rows against the page's last snapshot.
+
+    ``change`` is ``"added"`` or ``"removed"``. Detail pages resolved on earlier runs are not
+    revisited. An empty extraction is treated as a failure and leaves the snapshot alone; a
+    partial one (budget spent, crawl broken off) only adds to it and reports no removals.
+    """
+    return _changes(url, browser)[0]
+
+def iter_changes(url: str, browser: Optional[SharedBrowser] = None) -> Iterator[Dict]:
+    """``scrape_changes`` as output records carrying a ``change`` field."""
+    changes, method = _changes(url, browser)
+    firm = firm_of(url)
+    for change, *row in changes:
+        yield _record(firm, row, "snapshot" if change == "removed" else method, change)
+
+def _changes(url: str, browser: Optional[SharedBrowser]) -> Tuple[List[Tuple[str, str, str]], Optional[str]]:
+    if not url.startswith('http'):
+        url = 'https://' + url  # the snapshot is keyed by the page _extract scrapes
+    firm = firm_of(url)
+    budget = Budget(FIRM_BUDGET_S)
+    rows, method = _extract(url, browser, known_links(firm), budget=budget)
+    if not rows:
+        print(f"⚠️  {firm}: nothing extracted - keeping the previous snapshot")
+        return [], method
+
+    previous = set(_db("SELECT company, url FROM page_rows WHERE firm = ? AND page = ?", (firm, url)))
+    current = list(dict.fromkeys(rows))
+    added = [row for row in current if row not in previous]
+    if budget.partial:
+        # a cut-short scrape says nothing about the companies it didn't reach
+        for name, site in added:
+            _db("INSERT OR IGNORE INTO page_rows VALUES (?, ?, ?, ?)", (firm, url, name, site))
+        print(f"⚠️  {firm}: scrape was cut short - {len(added)} added, removals skipped until a full run")
+        return [("added", *row) for row in added], method
+    removed = sorted(previous.difference(current))
+
+    _db("DELETE FROM page_rows WHERE firm = ? AND page = ?", (firm, url))
+    for name, site in current:
+        _db("INSERT OR IGNORE INTO page_rows VALUES (?, ?, ?, ?)", (firm, url, name, site))
+
+    print(f"ℹ️  {firm}: {len(added)} added, {len(removed)} removed since last run")
+    return [("added", *row) for row in added] + [("removed", *row) for row in removed], method
+
+# ── service mode ────────────────────────────────────────────────────
+def _csv_text(records: List[Dict], fields: List[str]) -> str:
+    """Records as CSV with the same header and columns ``CsvSink`` writes for the CLI."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow([_HEADERS.get(field, field) for field in fields])
+    for record in records:
+        writer.writerow(["" if record.get(field) is None else record[field] for field in fields])
+    return out.getvalue()
+
+def _scrape_handler():
+    """The ``--serve`` request handler; http.server is only imported when serving."""
+    from http.server import BaseHTTPRequestHandler
+
+    class _ScrapeHandler(BaseHTTPRequestHandler):
+        """``GET /healthz``, ``GET /metrics`` (Prometheus), and ``POST /scrape`` with ``{"url", "format", "incremental"}``.
+
+        ``GET /scrape?url=...`` takes the same fields as query parameters. Results come
+        back as JSON unless ``format`` is ``"csv"`` or the client only accepts ``text/csv``;
+        either way each row is an output record with the CLI's columns.
+        """
+
+        server_version = "vc-scraper"
+
+        def do_GET(self) -> None:
+            parsed = urlparse(self.path)
+            if parsed.path == "/healthz":
+                self._send_json(200, {"ok": True})
+            elif parsed.path == "/metrics":
+                self._send(200, "text/plain; version=0.0.4", METRICS.prometheus())
+            elif parsed.path == "/scrape":
+                self._scrape({k: v[-1] for k, v in parse_qs(parsed.query).items()})
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            if urlparse(self.path).path != "/scrape":
+                return self._send_json(404, {"error": "not found"})
+            try:
+                params = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            except ValueError:
+                return self._send_json(400, {"error": "body must be JSON"})
+            if not isinstance(params, dict):
+                return self._send_json(400, {"error": "body must be a JSON object"})
+            self._scrape(params)
+
+        def _scrape(self, params: dict) -> None:
+            url = str(params.get("url") or "").strip()
+            if not url:
+                return self._send_json(400, {"error": "URL is required"})
+            target = url if url.startswith("http") else "https://" + url
+            incremental = str(params.get("incremental", "")).lower() in ("1", "true", "yes")
+
+            started = time.monotonic()
+            try:
+                if incremental:
+                    records = list(iter_changes(target, self.server.browser))
+                else:
+                    records = list(iter_companies(target, self.server.browser))
+            except Exception as e:
+                print(f"⚠️  {target} failed: {e}")
+                return self._send_json(500, {"error": str(e)})
+            elapsed = time.monotonic() - started
+
+            fields = CHANGE_FIELDS if incremental else OUTPUT_FIELDS
+            accept = self.headers.get("Accept", "")
+            fmt = params.get("format") or ("csv" if "text/csv" in accept and "json" not in accept else "json")
+            if fmt == "csv":
+                return self._send(200, "text/csv; charset=utf-8", _csv_text(records, fields))
+            self._send_json(200, {
+                "url": target,
+                "firm": firm_of(target),
+                "elapsed": round(elapsed, 2),
+                "changes" if incremental else "companies": [{f: r.get(f) for f in fields} for r in records],
+            })
+
+        def _send_json(self, status: int, payload: dict) -> None:
+            self._send(status, "application/json", json.dumps(payload))
+
+        def _send(self, status: int, content_type: str, body: str) -> None:
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args) -> None:
+            print(f"ℹ️  {self.address_string()} {format % args}")
+
+    return _ScrapeHandler
+
+def serve(host: str = SERVICE_HOST, port: int = SERVICE_PORT, browsers: int = SERVICE_BROWSERS) -> None:
+    """Serve scrapes over HTTP from one resident process.
+
+    Interpreter start-up, imports and the Chromium launch are paid once; each request
+    then borrows a warm browser context and the pooled HTTP client.
+    """
+    from http.server import ThreadingHTTPServer
+
+    with SharedBrowser(browsers, warm=True) as browser:
+        server = ThreadingHTTPServer((host, port), _scrape_handler())
+        server.daemon_threads = True
+        server.browser = browser
+        print(f"🚀  Serving scrapes on http://{host}:{port}/scrape with {browsers} warm browser(s)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("ℹ️  Shutting down")
+        finally:
+            server.server_close()
+
+# ── output sinks ────────────────────────────────────────────────────
+# Records are written as they are produced, so an interrupted run keeps what it
+# found and memory doesn't grow with the output. Pick the format with --format
+# or the output file's extension.
+OUTPUT_FIELDS = ["firm", "company", "url", "method", "scraped_at"]
+CHANGE_FIELDS = ["firm", "change", "company", "url", "method", "scraped_at"]
+_HEADERS = {"firm": "Firm", "change": "Change", "company": "Company", "url": "URL",
+            "method": "Method", "scraped_at": "Scraped At"}
+
+class RowSink(ABC):
+    """Writes output records to ``path`` in ``fields`` order as they arrive."""
+
+    def __init__(self, path: Path, fields: List[str]):
+        self.path, self.fields, self.count = path, fields, 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, record: Dict) -> None:
+        self._write([record.get(field) for field in self.fields])
+        self.count += 1
+
+    @abstractmethod
+    def _write(self, values: list) -> None:
+        """Write one record's values, in ``fields`` order."""
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+class CsvSink(RowSink):
+    def __init__(self, path: Path, fields: List[str]):
+        super().__init__(path, fields)
+        self._file = path.open("w", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._file)
+        self._csv.writerow([_HEADERS.get(field, field) for field in fields])
+        self._file.flush()
+
+    def _write(self, values: list) -> None:
+        self._csv.writerow(["" if value is None else value for value in values])
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+class JsonlSink(RowSink):
+    def __init__(self, path: Path, fields: List[str]):
+        super().__init__(path, fields)
+        self._file = path.open("w", encoding="utf-8")
+
+    def _write(self, values: list) -> None:
+        self._file.write(json.dumps(dict(zip(self.fields, values)), ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+class ParquetSink(RowSink):
+    """Parquet via pyarrow; rows are flushed as a row group every PARQUET_ROW_GROUP records."""
+
+    def __init__(self, path: Path, fields: List[str]):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+        super().__init__(path, fields)
+        self._pa = pyarrow
+        self._schema = pyarrow.schema([(field, pyarrow.string()) for field in fields])
+        self._writer = pyarrow.parquet.ParquetWriter(str(path), self._schema)
+        self._buffer: List[list] = []
+
+    def _write(self, values: list) -> None:
+        self._buffer.append(values)
+        if len(self._buffer) >= PARQUET_ROW_GROUP:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            columns = list(zip(*self._buffer))
+            self._writer.write_table(self._pa.table(
+                {field: list(column) for field, column in zip(self.fields, columns)}, schema=self._schema))
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+SINKS = {"csv": CsvSink, "jsonl": JsonlSink, "parquet": ParquetSink}
+
+def open_sink(path: Path, fields: List[str], fmt: Optional[str] = None) -> RowSink:
+    """A sink for ``path``; ``fmt`` defaults to the extension (.jsonl/.ndjson, .parquet, else CSV)."""
+    if fmt is None:
+        fmt = {".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}.get(path.suffix.lower(), "csv")
+    return SINKS[fmt](path, fields)
+
 # ── CLI wrapper ─────────────────────────────────────────────────────
 def main() -> None:
-    import sys
-    if len(sys.argv) != 2:
-        sys.exit("Usage: python vc_scraper.py <portfolio-URL>")
+    parser = argparse.ArgumentParser(description="Scrape company names and websites from VC portfolio pages.")
+    parser.add_argument("url", nargs="?", help="portfolio page to scrape")
+    parser.add_argument("--batch", metavar="FILE", help="scrape every URL listed in FILE ('-' for stdin)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS, help="targets scraped at once in batch mode")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="batch mode: worker processes, each with its own browsers; targets are sharded by domain")
+    parser.add_argument("-o", "--output", default="portfolio_companies.csv", help="file to write")
+    parser.add_argument("--format", choices=sorted(SINKS),
+                        help="output format (default: from the file extension, else csv)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only write rows added or removed since the previous run")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and don't update the on-disk HTTP cache")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip detail pages resolved by an interrupted run in the last 24 hours")
+    parser.add_argument("--rediscover", action="store_true",
+                        help="ignore saved site profiles and try every extraction strategy")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="seconds each portfolio may take, 0 for no limit (default 240)")
+    parser.add_argument("--no-breaker", action="store_true",
+                        help="scrape hosts even if their recent page loads kept failing")
+    parser.add_argument("--serve", action="store_true", help="run as a resident HTTP scrape service")
+    parser.add_argument("--host", default=SERVICE_HOST, help="address --serve listens on")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help="port --serve listens on")
+    parser.add_argument("--browsers", type=int, default=None,
+                        help=f"Chromium processes for --serve (default {SERVICE_BROWSERS}) or --batch (default 1)")
+    parser.add_argument("--metrics-log", metavar="FILE",
+                        help="append one JSON line of timings and counters per scrape ('-' for stderr)")
+    parser.add_argument("--metrics-file", metavar="FILE", help="keep Prometheus-format counters in FILE")
+    parser.add_argument("--profile", choices=("cprofile", "pyinstrument"), help="profile each scrape")
+    parser.add_argument("--profile-dir", help="where --profile writes its reports (default ./profiles)")
+    args = parser.parse_args()
+    if sum(map(bool, (args.url, args.batch, args.serve))) != 1:
+        parser.error("give either a portfolio URL, --batch FILE or --serve")
+    if args.no_cache:
+        global HTTP_CACHE
+        HTTP_CACHE = False
+    if args.rediscover:
+        global SITE_PROFILES
+        SITE_PROFILES = False
+    if args.resume:
+        global RESUME
+        RESUME = True
+    if args.budget is not None:
+        global FIRM_BUDGET_S
+        FIRM_BUDGET_S = args.budget or None
+    if args.no_breaker:
+        global BREAKER
+        BREAKER = False
+    global METRICS_LOG, METRICS_FILE, PROFILER, PROFILE_DIR
+    METRICS_LOG = args.metrics_log or METRICS_LOG
+    METRICS_FILE, PROFILER = args.metrics_file, args.profile
+    if args.profile_dir:
+        PROFILE_DIR = Path(args.profile_dir)
+    if args.serve:
+        return serve(args.host, args.port, args.browsers or SERVICE_BROWSERS)
 
-    target = sys.argv[1] if sys.argv[1].startswith("http") else "https://" + sys.argv[1]
-    data = extract_companies(target)
+    started = time.monotonic()
+    if args.batch:
+        records = iter_batch(read_targets(args.batch), workers=args.workers, incremental=args.incremental,
+                             browsers=args.browsers or 1, processes=args.processes)
+    else:
+        target = args.url if args.url.startswith("http") else "https://" + args.url
+        records = iter_changes(target) if args.incremental else iter_companies(target)
 
-    out = Path("portfolio_companies.csv")
-    with out.open("w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerows([("Company", "URL"), *data])
+    out = Path(args.output)
+    with open_sink(out, CHANGE_FIELDS if args.incremental else OUTPUT_FIELDS, args.format) as sink:
+        for record in records:
+            sink.write(record)
+    elapsed = time.monotonic() - started
 
-    print(f"✅  {len(data)} companies saved to {out}")
+    noun = "changes" if args.incremental else "companies"
+    print(f"✅  {sink.count} {noun} saved to {out} in {elapsed:.1f}s "
+          f"({sink.count / max(elapsed, 1e-6):.2f} {noun}/sec)")
 
 if __name__ == "__main__":
     main()